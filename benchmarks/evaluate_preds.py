@@ -0,0 +1,37 @@
+"""
+Benchmark of evaluate_preds with the NumPy backend against the TensorFlow backend.
+
+Reports the mean time per call on arrays of backtest size and checks both backends agree.
+
+Usage:
+    python -m benchmarks.evaluate_preds
+"""
+
+import timeit
+import numpy as np
+from timepulse.metrics.regression_metrics import evaluate_preds
+
+
+def main(sizes=(7, 30, 365, 10_000), number: int = 200, repeat: int = 3) -> None:
+    rng = np.random.default_rng(42)
+    for n in sizes:
+        y_true = rng.random(n).astype(np.float32)
+        y_pred = rng.random(n).astype(np.float32)
+        reference = evaluate_preds(y_true, y_pred, backend="tensorflow")
+        result = evaluate_preds(y_true, y_pred, backend="numpy")
+        assert all(np.allclose(reference[k], result[k], rtol=1e-5) for k in reference)
+
+        timings = {}
+        for backend in ["tensorflow", "numpy"]:
+            func = lambda: evaluate_preds(y_true, y_pred, backend=backend)
+            seconds = min(timeit.repeat(func, number=number, repeat=repeat))
+            timings[backend] = seconds / number
+        print(
+            f"n={n:>6}: tensorflow {timings['tensorflow'] * 1e6:10.1f} us"
+            f"  numpy {timings['numpy'] * 1e6:10.1f} us"
+            f"  speedup {timings['tensorflow'] / timings['numpy']:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
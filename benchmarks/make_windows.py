@@ -0,0 +1,44 @@
+"""
+Benchmark of make_windows with copied windows against strided views.
+
+Reports the best wall time and the peak traced allocation of both modes.
+
+Usage:
+    python -m benchmarks.make_windows
+"""
+
+import timeit
+import tracemalloc
+import numpy as np
+from timepulse.utils.splits import make_windows
+
+
+def peak_memory_mb(func) -> float:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main(
+    n: int = 100_000, window_size: int = 365, horizon: int = 7, repeat: int = 3
+) -> None:
+    x = np.random.random(n)
+    copied = make_windows(x, window_size=window_size, horizon=horizon)
+    viewed = make_windows(x, window_size=window_size, horizon=horizon, copy=False)
+    assert all(np.array_equal(c, v) for c, v in zip(copied, viewed))
+    del copied, viewed
+
+    for copy in [True, False]:
+        func = lambda: make_windows(
+            x, window_size=window_size, horizon=horizon, copy=copy
+        )
+        seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(
+            f"copy={copy!s:>5}: {seconds * 1000:10.2f} ms {peak_memory_mb(func):10.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
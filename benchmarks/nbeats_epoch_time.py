@@ -0,0 +1,65 @@
+"""
+Benchmark of NBeats epoch time with NumPy array inputs against the tf.data input pipeline.
+
+Uses the NBeats defaults (30 stacks of 4 layers of 512 neurons, batch size 1024) on a
+synthetic series. Only a few epochs are timed, the first one, which includes tracing, is
+left out, and the time of the default 5000 epochs is extrapolated from the median epoch.
+
+Usage:
+    python -m benchmarks.nbeats_epoch_time
+"""
+
+import time
+import numpy as np
+import tensorflow as tf
+from timepulse.models.nbeats import NBeats
+from timepulse.utils.splits import make_window_splits
+
+
+class EpochTimer(tf.keras.callbacks.Callback):
+    def on_train_begin(self, logs=None):
+        self.times = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.start = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.times.append(time.perf_counter() - self.start)
+
+
+def main(
+    n_samples: int = 8192,
+    window_size: int = 7,
+    n_stacks: int = 30,
+    n_neurons: int = 512,
+    batch_size: int = 1024,
+    epochs: int = 4,
+    default_epochs: int = 5000,
+) -> None:
+    series = np.sin(np.arange(n_samples + window_size) / 10).astype(np.float32)
+    X_train, X_val, y_train, y_val = make_window_splits(series, size=window_size)
+    y_train, y_val = y_train.flatten(), y_val.flatten()
+
+    for use_tf_data in [False, True]:
+        timer = EpochTimer()
+        model_instance = NBeats(
+            window_size=window_size,
+            n_stacks=n_stacks,
+            n_neurons=n_neurons,
+            batch_size=batch_size,
+            epochs=epochs,
+            callbacks=[timer],
+            use_tf_data=use_tf_data,
+        )
+        model_instance.build()
+        model_instance.compile()
+        model_instance.fit(X_train, y_train, X_val, y_val)
+        epoch_time = np.median(timer.times[1:])
+        print(
+            f"use_tf_data={use_tf_data!s:>5}: {epoch_time * 1000:10.1f} ms/epoch"
+            f"  {epoch_time * default_epochs / 3600:6.2f} h for {default_epochs} epochs"
+        )
+
+
+if __name__ == "__main__":
+    main()
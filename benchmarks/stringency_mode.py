@@ -0,0 +1,57 @@
+"""
+Benchmark of the per-period stringency category mode.
+
+Compares the previous `resample(...).agg(lambda x: x.mode().iloc[0])` implementation
+with the bincount based `_categorise_stringency`.
+
+Usage:
+    python -m benchmarks.stringency_mode
+"""
+
+import timeit
+import numpy as np
+import pandas as pd
+from timepulse.data.data_collection import _categorise_stringency
+
+
+def lambda_mode(
+    values: np.ndarray, dates: pd.DatetimeIndex, period: str
+) -> pd.DataFrame:
+    values = np.nan_to_num(values, nan=0.0)
+    strigency_index_df = pd.DataFrame(
+        {"stringency_index": values.ravel(order="F")},
+        index=pd.DatetimeIndex(dates.repeat(values.shape[0]), name="Date"),
+    )
+    strigency_index_df["stringency_category"] = pd.cut(
+        strigency_index_df["stringency_index"],
+        bins=[-1, 33.0, 66.0, 110.0],
+        labels=[0, 1, 2],
+    )
+    strigency_index_df = strigency_index_df.resample(period).agg(
+        {"stringency_category": lambda x: x.mode().iloc[0]}
+    )
+    return strigency_index_df.fillna(0)
+
+
+def main(n_rows: int = 3, n_days: int = 1100, repeat: int = 5) -> None:
+    dates = pd.date_range("2020-01-01", periods=n_days, freq="D")
+    values = np.round(np.random.uniform(0, 100, (n_rows, n_days)), 2)
+    for period in ["D", "M"]:
+        pd.testing.assert_frame_equal(
+            lambda_mode(values, dates, period),
+            _categorise_stringency(values, dates, period),
+        )
+        for name, func in [
+            ("lambda", lambda_mode),
+            ("bincount", _categorise_stringency),
+        ]:
+            seconds = min(
+                timeit.repeat(
+                    lambda: func(values, dates, period), number=1, repeat=repeat
+                )
+            )
+            print(f"period={period} {name:>8}: {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
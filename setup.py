@@ -12,7 +12,7 @@ setup(
     author="SQUAREDEV BV",
     author_email="hello@squaredev.io",
     url="https://github.com/squaredev-io/timepulse",
-    packages=find_packages(exclude=("tests", "docs")),
+    packages=find_packages(exclude=("tests", "docs", "benchmarks")),
     install_requires=[
         "holidays>=0.38",
         "joblib>=1.1.1",
@@ -1,6 +1,9 @@
 v1_test_order_map = [
     "test_regression_metrics",
     "test_splits",
+    "test_datasets",
+    "test_window_store",
+    "test_streaming",
     "test_data_collection",
     "test_scalers",
     "test_lstm",
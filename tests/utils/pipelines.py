@@ -1,5 +1,10 @@
 import pandas as pd
-from timepulse.data.data_collection import fetch_holidays, fetch_stringency_index
+from functools import partial
+from timepulse.data.data_collection import (
+    fetch_holidays,
+    fetch_stringency_index,
+    prefetch_sources,
+)
 from timepulse.utils.splits import (
     create_multivar_dataframe,
     create_windowed_dataframe,
@@ -23,9 +28,13 @@ def multi_data_pipeline(
     df.index = pd.to_datetime(df.index)
     df = df[["value"]]
     years = df.index.year.unique()
-    holidays_df = fetch_holidays(years=years, country_code=country_code)
-    stringency_index_df = fetch_stringency_index(country_code)
-    multivar_df = create_multivar_dataframe(df, stringency_index_df, holidays_df)
+    stringency_index_future, holidays_future = prefetch_sources(
+        partial(fetch_stringency_index, country_code),
+        partial(fetch_holidays, years=years, country_code=country_code),
+    )
+    multivar_df = create_multivar_dataframe(
+        df, stringency_index_future, holidays_future
+    )
     multivar_df = create_windowed_dataframe(
         base_df=multivar_df, target_column=target_column, window_size=window_size
     )
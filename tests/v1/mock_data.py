@@ -233,3 +233,55 @@ mixed_interval_mock_data = pd.DataFrame(
         "value": [random.random() for _ in range(100)],
     }
 )
+
+
+def create_mock_stringency_csv(
+    path,
+    start_date="2020-01-01",
+    periods=400,
+    countries={"Spain": [""], "Italy": [""], "United States": ["", "Texas", "Ohio"]},
+):
+    """
+    Write a small csv with the same wide layout as the OxCGRT stringency_index_avg.csv.
+
+    Parameters:
+    - path (str): Where the csv is written.
+    - start_date (str): The first date column (default: 2020-01-01).
+    - periods (int): The number of daily date columns (default: 400).
+    - countries (dict): Country names mapped to their region names, "" being the national row.
+
+    Returns:
+    - str: The path of the written csv.
+
+    Example:
+    - csv_path = create_mock_stringency_csv(tmp_path / "stringency_index_avg.csv")
+    """
+    dates = pd.date_range(start=start_date, periods=periods, freq="D")
+    rows = []
+    for country_name, regions in countries.items():
+        for region in regions:
+            values = np.round(np.random.uniform(0, 100, periods), 2)
+            values[np.random.random(periods) < 0.05] = np.nan
+            rows.append(
+                [
+                    country_name[:3].upper(),
+                    country_name,
+                    region,
+                    region,
+                    "STATE_TOTAL" if region else "NAT_TOTAL",
+                    *values,
+                ]
+            )
+    df = pd.DataFrame(
+        rows,
+        columns=[
+            "country_code",
+            "country_name",
+            "region_code",
+            "region_name",
+            "jurisdiction",
+            *dates.strftime("%d%b%Y"),
+        ],
+    )
+    df.to_csv(path)
+    return str(path)
@@ -1,6 +1,21 @@
+import holidays
+import threading
+import numpy as np
+import pandas as pd
 import pytest
+from concurrent.futures import Future
+from functools import partial
 from tests.v1.conftest import get_order_number
-from timepulse.data.data_collection import fetch_stringency_index, fetch_holidays
+from tests.v1.mock_data import create_mock_stringency_csv
+from timepulse.data import data_collection
+from timepulse.data.data_collection import (
+    fetch_stringency_index,
+    fetch_stringency_indexes,
+    fetch_holidays,
+    fetch_holidays_panel,
+    prefetch_sources,
+)
+from timepulse.utils.splits import create_multivar_dataframe
 
 
 @pytest.mark.order(get_order_number("test_data_collection"))
@@ -17,3 +32,186 @@ def test_data_collection():
     assert (
         holidays_df.index.name == "Date"
     ), "The index name is not set to 'Date' in holidays DataFrame"
+
+
+@pytest.mark.order(get_order_number("test_data_collection"))
+def test_stringency_index_cache(tmp_path, monkeypatch):
+    csv_path = create_mock_stringency_csv(tmp_path / "stringency_index_avg.csv")
+    offline_df = fetch_stringency_index("Spain", period="D", local_path=csv_path)
+    assert len(offline_df) == 400
+    assert offline_df.index.name == "Date"
+
+    # The first call downloads (here: reads the mock csv) and writes the snapshot
+    monkeypatch.setattr(data_collection, "STRINGENCY_INDEX_AVG_URL", csv_path)
+    cache_dir = tmp_path / "cache"
+    cached_df = fetch_stringency_index("Spain", period="D", cache_dir=str(cache_dir))
+    snapshot_path = cache_dir / data_collection.STRINGENCY_INDEX_SNAPSHOT
+    assert snapshot_path.exists()
+    pd.testing.assert_frame_equal(offline_df, cached_df)
+
+    # Fresh snapshots are served without touching the source
+    monkeypatch.setattr(data_collection, "STRINGENCY_INDEX_AVG_URL", "missing.csv")
+    cached_df = fetch_stringency_index("Spain", period="D", cache_dir=str(cache_dir))
+    pd.testing.assert_frame_equal(offline_df, cached_df)
+    snapshot_df = fetch_stringency_index(
+        "Spain", period="D", local_path=str(snapshot_path)
+    )
+    pd.testing.assert_frame_equal(offline_df, snapshot_df)
+
+    # Expired snapshots are refreshed from the source
+    with pytest.raises(FileNotFoundError):
+        fetch_stringency_index("Spain", cache_dir=str(cache_dir), cache_ttl=-1)
+
+    # Corrupt snapshots are rejected in offline mode and refetched otherwise
+    snapshot_path.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError):
+        fetch_stringency_index("Spain", local_path=str(snapshot_path))
+    monkeypatch.setattr(data_collection, "STRINGENCY_INDEX_AVG_URL", csv_path)
+    cached_df = fetch_stringency_index("Spain", period="D", cache_dir=str(cache_dir))
+    pd.testing.assert_frame_equal(offline_df, cached_df)
+
+
+@pytest.mark.order(get_order_number("test_data_collection"))
+def test_stringency_index_panel(tmp_path):
+    csv_path = create_mock_stringency_csv(tmp_path / "stringency_index_avg.csv")
+    countries = ["Spain", "United States", "Atlantis"]
+    panel_df = fetch_stringency_indexes(countries, period="M", local_path=csv_path)
+
+    assert panel_df.index.names == ["country", "Date"]
+    assert list(panel_df.index.unique(level="country")) == ["Spain", "United States"]
+    for country in countries[:2]:
+        country_df = fetch_stringency_index(country, period="M", local_path=csv_path)
+        pd.testing.assert_frame_equal(
+            panel_df.xs(country, level="country"), country_df, check_freq=False
+        )
+
+    empty_df = fetch_stringency_indexes(["Atlantis"], local_path=csv_path)
+    assert empty_df.empty
+    assert empty_df.index.names == ["country", "Date"]
+
+
+@pytest.mark.order(get_order_number("test_data_collection"))
+def test_stringency_category_mode():
+    dates = pd.date_range("2020-01-20", periods=60, freq="D")
+    values = np.random.choice([10.0, 50.0, 80.0, np.nan], size=(3, 60))
+    # Three rows with three different categories tie on every day
+    values[:, 0] = [80.0, 50.0, 10.0]
+
+    for period in ["D", "M"]:
+        expected_df = pd.DataFrame(
+            {"stringency_index": np.nan_to_num(values).ravel(order="F")},
+            index=pd.DatetimeIndex(dates.repeat(3), name="Date"),
+        )
+        expected_df["stringency_category"] = pd.cut(
+            expected_df["stringency_index"],
+            bins=[-1, 33.0, 66.0, 110.0],
+            labels=[0, 1, 2],
+        )
+        expected_df = expected_df.resample(period).agg(
+            {"stringency_category": lambda x: x.mode().iloc[0]}
+        )
+        result_df = data_collection._categorise_stringency(values, dates, period)
+        pd.testing.assert_frame_equal(result_df, expected_df.fillna(0))
+
+    assert data_collection._categorise_stringency(values, dates, "D").iloc[0, 0] == 0
+
+
+@pytest.mark.order(get_order_number("test_data_collection"))
+def test_stringency_index_streaming(tmp_path):
+    csv_path = create_mock_stringency_csv(tmp_path / "stringency_index_avg.csv")
+    country_names, date_columns, values = data_collection.load_stringency_table(
+        local_path=csv_path,
+        countries=["United States"],
+        start="2020-02-01",
+        end="2020-03-31",
+        chunksize=2,
+    )
+    assert list(country_names) == ["United States"] * 3
+    assert len(date_columns) == 29 + 31
+    assert values.dtype == np.float32
+    assert values.shape == (3, 60)
+
+    full_df = fetch_stringency_index("United States", period="D", local_path=csv_path)
+    for chunksize in [None, 1, 64]:
+        range_df = fetch_stringency_index(
+            "United States",
+            period="D",
+            local_path=csv_path,
+            start="2020-02-01",
+            end="2020-03-31",
+            chunksize=chunksize,
+        )
+        pd.testing.assert_frame_equal(
+            range_df, full_df.loc["2020-02-01":"2020-03-31"], check_freq=False
+        )
+
+    # Snapshots are filtered the same way after loading
+    snapshot_path = str(tmp_path / data_collection.STRINGENCY_INDEX_SNAPSHOT)
+    data_collection._save_snapshot(
+        snapshot_path, *data_collection.load_stringency_table(local_path=csv_path)
+    )
+    snapshot_table = data_collection.load_stringency_table(
+        local_path=snapshot_path,
+        countries=["United States"],
+        start="2020-02-01",
+        end="2020-03-31",
+    )
+    assert np.array_equal(snapshot_table[0], country_names)
+    assert np.array_equal(snapshot_table[1], date_columns)
+    assert np.array_equal(snapshot_table[2], values, equal_nan=True)
+
+
+@pytest.mark.order(get_order_number("test_data_collection"))
+def test_holiday_calendar():
+    years = [2021, 2020]
+    holidays_dict = holidays.country_holidays("ES", years=years)
+    for period in ["D", "M"]:
+        expected_df = pd.DataFrame(
+            {"total_holidays": [1 for _ in range(len(holidays_dict.keys()))]},
+            index=pd.to_datetime(list(holidays_dict.keys())),
+        )
+        expected_df.index.name = "Date"
+        expected_df = expected_df.resample(period).agg({"total_holidays": "sum"})
+        pd.testing.assert_frame_equal(
+            fetch_holidays(years=years, country_code="ES", period=period), expected_df
+        )
+
+    first_date, bitmap = data_collection.holiday_calendar("ES", [2020, 2021, 2020])
+    assert first_date == np.datetime64("2020-01-01")
+    assert bitmap.sum() == len(holidays_dict)
+    assert not bitmap.flags.writeable
+    # Same calendar object, served from the cache
+    assert data_collection.holiday_calendar("ES", years)[1] is bitmap
+
+    panel_df = fetch_holidays_panel(years=years, country_codes=["ES", "IT"])
+    assert panel_df.index.names == ["country", "Date"]
+    pd.testing.assert_frame_equal(
+        panel_df.xs("IT", level="country"),
+        fetch_holidays(years=years, country_code="IT"),
+        check_freq=False,
+    )
+
+
+@pytest.mark.order(get_order_number("test_data_collection"))
+def test_prefetch_sources():
+    dates = pd.date_range("2021-01-31", periods=12, freq="M", name="Date")
+    base_df = pd.DataFrame({"value": np.arange(12.0)}, index=dates)
+    # Every stand-in source blocks until all of them run at the same time
+    barrier = threading.Barrier(3, timeout=10)
+
+    def stand_in_source(column):
+        barrier.wait()
+        return pd.DataFrame({column: np.ones(12, dtype=int)}, index=dates)
+
+    futures = prefetch_sources(
+        *[partial(stand_in_source, column) for column in ["a", "b", "c"]]
+    )
+    assert all(isinstance(future, Future) for future in futures)
+
+    multivar_df = create_multivar_dataframe(base_df, *futures)
+    assert list(multivar_df.columns) == ["value", "a", "b", "c"]
+    assert (multivar_df[["a", "b", "c"]] == 1).all().all()
+    pd.testing.assert_frame_equal(
+        multivar_df,
+        create_multivar_dataframe(base_df, *[future.result() for future in futures]),
+    )
@@ -0,0 +1,122 @@
+import pytest
+from tests.v1.conftest import get_order_number
+from timepulse.utils.datasets import (
+    make_array_dataset,
+    make_windowed_dataset,
+    make_windowed_datasets,
+)
+from timepulse.utils.splits import make_window_splits
+from timepulse.models.nn import MultivariateDense
+from timepulse.models.lstm import LSTM
+from timepulse.models.nbeats import NBeats
+import numpy as np
+
+
+@pytest.mark.order(get_order_number("test_datasets"))
+def test_datasets():
+    values = np.arange(100, dtype=np.float64)
+    train_dataset, test_dataset = make_windowed_datasets(
+        values, window_size=7, horizon=2, test_split=0.2, batch_size=16, shuffle=False
+    )
+    train_windows, test_windows, train_labels, test_labels = make_window_splits(
+        values, size=7, horizon=2
+    )
+    batches = list(train_dataset.as_numpy_iterator())
+    assert batches[0][0].shape == (16, 7) and batches[0][1].shape == (16, 2)
+    assert batches[0][0].dtype == np.float32
+
+    n_windows = len(values) - 8
+    split_size = int(n_windows * 0.8)
+    dataset_windows = np.concatenate([windows for windows, _ in batches])
+    dataset_labels = np.concatenate([labels for _, labels in batches])
+    all_windows = np.concatenate([train_windows, test_windows])
+    all_labels = np.concatenate([train_labels, test_labels])
+    assert np.array_equal(dataset_windows, all_windows[:split_size])
+    assert np.array_equal(dataset_labels, all_labels[:split_size])
+    test_batches = list(test_dataset.as_numpy_iterator())
+    assert np.array_equal(
+        np.concatenate([windows for windows, _ in test_batches]),
+        all_windows[split_size:],
+    )
+
+    # Shuffling reorders the training windows only, differently at every epoch
+    shuffled_dataset, _ = make_windowed_datasets(
+        values, window_size=7, horizon=2, test_split=0.2, seed=0
+    )
+    epochs = [
+        np.concatenate([windows for windows, _ in shuffled_dataset.as_numpy_iterator()])
+        for _ in range(2)
+    ]
+    assert not np.array_equal(epochs[0], epochs[1])
+    for epoch_windows in epochs:
+        assert np.array_equal(
+            epoch_windows[np.argsort(epoch_windows[:, 0])], all_windows[:split_size]
+        )
+
+    multivariate_values = np.stack([values, values * 10], axis=1)
+    dataset = make_windowed_dataset(
+        multivariate_values, window_size=5, horizon=1, target_column=1, batch_size=4
+    )
+    windows, labels = next(dataset.as_numpy_iterator())
+    assert windows.shape == (4, 5, 2)
+    assert np.array_equal(labels[:, 0], multivariate_values[5:9, 1])
+
+
+@pytest.mark.order(get_order_number("test_datasets"))
+def test_fit_on_datasets():
+    values = np.sin(np.arange(300) / 10)
+    train_dataset, test_dataset = make_windowed_datasets(values, window_size=10)
+    X_test = np.concatenate([windows for windows, _ in test_dataset])
+
+    for model_instance in [
+        MultivariateDense(horizon=1, epochs=2, scaler_class=None),
+        NBeats(window_size=10, n_neurons=16, n_stacks=2, epochs=2, scaler_class=None),
+    ]:
+        model_instance.build()
+        model_instance.compile()
+        model_instance.fit(train_dataset, X_val=test_dataset)
+        assert model_instance.predict(X_test).shape == (len(X_test),)
+
+    sequence_train, sequence_test = make_windowed_datasets(
+        values.reshape(-1, 1), window_size=10, target_column=0
+    )
+    lstm = LSTM(input_shape=(10, 1), n_neurons=8, epochs=2, scaler_class=None)
+    lstm.build()
+    lstm.compile()
+    lstm.fit(sequence_train, X_val=sequence_test)
+
+    with pytest.raises(ValueError):
+        scaled_model = MultivariateDense(horizon=1, epochs=1)
+        scaled_model.build()
+        scaled_model.compile()
+        scaled_model.fit(train_dataset, X_val=test_dataset)
+
+
+@pytest.mark.order(get_order_number("test_datasets"))
+def test_array_datasets():
+    X = np.arange(50, dtype=np.float32).reshape(25, 2)
+    y = np.arange(25, dtype=np.float32)
+
+    batches = list(make_array_dataset(X, y, batch_size=10))
+    assert [len(labels) for _, labels in batches] == [10, 10, 5]
+    assert np.array_equal(np.concatenate([labels for _, labels in batches]), y)
+
+    # Every epoch serves all samples once, in a new order, with matching pairs
+    dataset = make_array_dataset(X, y, batch_size=10, shuffle=True, seed=0)
+    epochs = [list(dataset) for _ in range(2)]
+    orders = [np.concatenate([labels for _, labels in batches]) for batches in epochs]
+    assert all(np.array_equal(np.sort(order), y) for order in orders)
+    assert not np.array_equal(orders[0], orders[1])
+    for windows, labels in epochs[0]:
+        assert np.array_equal(windows.numpy()[:, 0], 2 * labels.numpy())
+
+    X_train, X_test, y_train, y_test = make_window_splits(np.sin(np.arange(300) / 10))
+    for model_instance in [
+        MultivariateDense(horizon=1, epochs=2, use_tf_data=True),
+        LSTM(input_shape=(1, 10), n_neurons=8, epochs=2, use_tf_data=True),
+        NBeats(window_size=10, n_neurons=16, n_stacks=2, epochs=2, use_tf_data=True),
+    ]:
+        model_instance.build()
+        model_instance.compile()
+        model_instance.fit(X_train, y_train.flatten(), X_test, y_test.flatten())
+        assert model_instance.predict(X_test).shape == (len(X_test),)
@@ -3,6 +3,12 @@ from tests.v1.conftest import get_order_number
 from timepulse.models.lstm import LSTM
 from tests.utils.pipelines import multi_data_pipeline
 from timepulse.utils.models import run_model
+from timepulse.utils.splits import (
+    make_windows,
+    make_multivariate_windows,
+    make_train_test_splits,
+)
+import numpy as np
 
 
 @pytest.mark.order(get_order_number("test_lstm"))
@@ -30,3 +36,40 @@ def test_lstm():
     assert all(
         result_metrics[metric] is not None for metric in expected_metrics
     ), "Some metric values are None"
+
+
+@pytest.mark.order(get_order_number("test_lstm"))
+def test_lstm_multivariate_windows():
+    n_timesteps = 200
+    series = np.sin(np.arange(n_timesteps) / 5)
+    exog = np.cos(np.arange(n_timesteps) / 7)
+    windows, labels = make_multivariate_windows(
+        np.stack([series, exog], axis=1), window_size=12, horizon=1, target_column=0
+    )
+    X_train, X_test, y_train, y_test = make_train_test_splits(
+        windows, labels, test_split=0.2
+    )
+    y_test = y_test.flatten()
+
+    lstm = LSTM(horizon=1, n_neurons=8, epochs=2, input_shape=(12, 2))
+    y_pred, result_metrics = run_model(lstm, X_train, y_train, X_test, y_test)
+    assert lstm.model.input_shape == (None, 12, 2)
+    assert y_pred.shape == y_test.shape, "Shape mismatch between y_pred and y_test"
+    assert all(result_metrics[metric] is not None for metric in result_metrics)
+
+
+@pytest.mark.order(get_order_number("test_lstm"))
+def test_lstm_in_graph_scaling():
+    series = np.sin(np.arange(200) / 5) * 10 + 50
+    windows, labels = make_windows(series, window_size=6, horizon=1)
+    X_train, X_test, y_train, y_test = make_train_test_splits(
+        windows, labels, test_split=0.2
+    )
+    y_train, y_test = y_train.flatten(), y_test.flatten()
+
+    lstm = LSTM(n_neurons=8, epochs=2, input_shape=(1, 6), in_graph_scaling=True)
+    y_pred, _ = run_model(lstm, X_train, y_train, X_test, y_test)
+    # Raw 2D lag inputs are reshaped to timesteps inside the serving model
+    assert lstm.serving_model.input_shape == (None, 6)
+    lstm.serving_model = None
+    assert np.allclose(y_pred, lstm.predict(X_test), atol=1e-4)
@@ -1,8 +1,12 @@
 import pandas as pd
+import numpy as np
 import pytest
+import tensorflow as tf
 from timepulse.models.nn import MultivariateDense
 from timepulse.utils.models import run_model
 from timepulse.processing.min_max_scaler import MinMaxScalerWrapper
+from timepulse.processing.standard_scaler import StandardScalerWrapper
+from timepulse.utils.splits import make_windows, make_train_test_splits
 from tests.v1.conftest import get_order_number
 from tests.utils.pipelines import multi_data_pipeline
 
@@ -53,3 +57,29 @@ def test_nn():
     assert all(
         result_metrics[metric] is not None for metric in expected_metrics
     ), "Some metric values are None"
+
+
+@pytest.mark.order(get_order_number("test_nn"))
+def test_nn_in_graph_scaling(tmp_path):
+    series = np.sin(np.arange(300) / 5) * 10 + 50
+    windows, labels = make_windows(series, window_size=6, horizon=1)
+    X_train, X_test, y_train, y_test = make_train_test_splits(
+        windows, labels, test_split=0.2
+    )
+    y_train, y_test = y_train.flatten(), y_test.flatten()
+
+    model_instance = MultivariateDense(
+        epochs=2, scaler_class=StandardScalerWrapper(), in_graph_scaling=True
+    )
+    y_pred, _ = run_model(model_instance, X_train, y_train, X_test, y_test)
+    serving_model = model_instance.serving_model
+    assert serving_model is not None
+
+    # Same predictions as the sklearn round trip
+    model_instance.serving_model = None
+    assert np.allclose(y_pred, model_instance.predict(X_test), atol=1e-4)
+
+    # The saved model takes raw inputs and returns unscaled predictions
+    serving_model.save(tmp_path / "serving_model.keras")
+    loaded_model = tf.keras.models.load_model(tmp_path / "serving_model.keras")
+    assert np.allclose(loaded_model(X_test).numpy().flatten(), y_pred, atol=1e-4)
@@ -1,6 +1,15 @@
 import pytest
 from tests.v1.conftest import get_order_number
 from timepulse.metrics.regression_metrics import evaluate_preds
+from timepulse.metrics.numpy_metrics import (
+    evaluate_batch,
+    evaluate_horizon,
+    register_metric,
+    METRICS,
+    METRIC_NAMES,
+)
+from timepulse.metrics.streaming_metrics import MetricsAccumulator
+from timepulse.utils.splits import make_windows
 import numpy as np
 import tensorflow as tf
 
@@ -14,3 +23,130 @@ def test_regression_metrics():
     for key in result:
         assert result[key] is not None
         assert not np.isnan(result[key])
+
+
+@pytest.mark.order(get_order_number("test_regression_metrics"))
+def test_regression_metrics_numpy_backend():
+    rng = np.random.default_rng(0)
+    cases = [
+        (rng.normal(size=50), rng.normal(size=50)),
+        (rng.normal(size=(20, 7)), rng.normal(size=(20, 7))),
+        (np.zeros(10), rng.normal(size=10)),
+        (np.ones(5), np.ones(5)),
+    ]
+    for y_true, y_pred in cases:
+        expected = evaluate_preds(y_true, y_pred, backend="tensorflow")
+        result = evaluate_preds(y_true, y_pred, backend="numpy")
+        assert result.keys() == expected.keys()
+        for key in expected:
+            assert np.shape(result[key]) == np.shape(expected[key])
+            assert np.allclose(result[key], expected[key], rtol=1e-5, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        evaluate_preds(y_true, y_pred, backend="torch")
+
+
+@pytest.mark.order(get_order_number("test_regression_metrics"))
+def test_evaluate_batch():
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(size=(10, 2, 3, 7))
+    y_pred = y_true + rng.normal(size=y_true.shape)
+
+    result = evaluate_batch(y_true, y_pred)
+    assert result.shape == (10, 2, 3)
+    assert list(result.dtype.names) == METRIC_NAMES
+    for index in np.ndindex(result.shape):
+        expected = evaluate_preds(y_true[index], y_pred[index])
+        for key in METRIC_NAMES:
+            assert np.isclose(result[index][key], expected[key], rtol=1e-5)
+
+    # Ragged series, MASE uses the naive scale of each series
+    lengths = rng.integers(2, 20, size=12)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    y_true = rng.normal(size=offsets[-1]).cumsum()
+    y_pred = y_true + rng.normal(size=offsets[-1])
+    result = evaluate_batch(y_true, y_pred, offsets=offsets)
+    assert result.shape == (12,)
+    for i, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        expected = evaluate_preds(y_true[start:end], y_pred[start:end])
+        for key in METRIC_NAMES:
+            assert np.isclose(result[i][key], expected[key], rtol=1e-5)
+
+
+@pytest.mark.order(get_order_number("test_regression_metrics"))
+def test_metrics_accumulator():
+    rng = np.random.default_rng(1)
+    y_true = rng.normal(size=500).cumsum()
+    y_pred = y_true + rng.normal(size=500)
+    expected = evaluate_preds(y_true, y_pred)
+
+    bounds = [0, 1, 120, 120, 333, 500]
+    chunks = list(zip(bounds[:-1], bounds[1:]))
+    sequential = MetricsAccumulator()
+    for start, end in chunks:
+        sequential.update(y_true[start:end], y_pred[start:end])
+    # Workers accumulate consecutive chunks, then their accumulators are merged in order
+    workers = [MetricsAccumulator().update(y_true[a:b], y_pred[a:b]) for a, b in chunks]
+    merged = workers[0].merge(workers[1]).merge(workers[2].merge(workers[3]))
+    merged.merge(workers[4])
+
+    for result in [sequential.result(), merged.result()]:
+        assert result.keys() == expected.keys()
+        for key in expected:
+            assert np.isclose(result[key], expected[key], rtol=1e-5)
+
+    selected = MetricsAccumulator(["mae", "mase"]).update(y_true, y_pred).result()
+    assert list(selected) == ["mae", "mase"]
+
+
+@pytest.mark.order(get_order_number("test_regression_metrics"))
+def test_metric_registry():
+    rng = np.random.default_rng(2)
+    y_true = rng.normal(size=100)
+    y_pred = y_true + rng.normal(size=100)
+    expected = evaluate_preds(y_true, y_pred)
+
+    selected = evaluate_preds(y_true, y_pred, metrics=["mae", "mase"])
+    assert list(selected) == ["mae", "mase"]
+    assert selected["mase"] == expected["mase"]
+    assert list(
+        evaluate_preds(y_true, y_pred, backend="tensorflow", metrics=["r2_score"])
+    ) == ["r2_score"]
+
+    @register_metric("max_error")
+    def max_error(inputs):
+        return np.max(inputs.abs_errors)
+
+    try:
+        result = evaluate_preds(y_true, y_pred, metrics=["mae", "max_error"])
+        assert np.isclose(result["max_error"], np.max(np.abs(y_true - y_pred)))
+        with pytest.raises(ValueError):
+            register_metric("max_error", max_error)
+        with pytest.raises(ValueError):
+            evaluate_preds(y_true, y_pred, metrics=["max_error"], backend="tensorflow")
+    finally:
+        METRICS.pop("max_error")
+    with pytest.raises(ValueError):
+        evaluate_preds(y_true, y_pred, metrics=["max_error"])
+
+
+@pytest.mark.order(get_order_number("test_regression_metrics"))
+def test_evaluate_horizon():
+    rng = np.random.default_rng(3)
+    _, labels = make_windows(rng.normal(size=200).cumsum(), window_size=7, horizon=4)
+    y_pred = labels + rng.normal(size=labels.shape) * np.arange(1, 5)
+
+    by_step, aggregate = evaluate_horizon(labels, y_pred)
+    assert list(by_step) == METRIC_NAMES
+    for step in range(4):
+        expected = evaluate_preds(labels[:, step], y_pred[:, step])
+        for key in METRIC_NAMES:
+            assert np.isclose(by_step[key][step], expected[key], rtol=1e-5)
+    assert np.isclose(aggregate["mae"], np.mean(np.abs(labels - y_pred)), rtol=1e-5)
+    assert np.all(np.diff(by_step["mae"]) > 0)
+
+    by_step, aggregate = evaluate_horizon(
+        np.stack([labels, labels]), np.stack([y_pred, labels]), metrics=["mae"]
+    )
+    assert by_step["mae"].shape == (2, 4)
+    assert aggregate["mae"][1] == 0
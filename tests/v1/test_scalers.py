@@ -2,6 +2,7 @@ import pytest
 from tests.v1.conftest import get_order_number
 from timepulse.processing.min_max_scaler import MinMaxScalerWrapper
 from timepulse.processing.standard_scaler import StandardScalerWrapper
+from timepulse.processing.scaler_bank import MinMaxScalerBank, StandardScalerBank
 import numpy as np
 
 
@@ -62,3 +63,93 @@ def test_scalers():
 
     inverse_transformed_y = scaler_wrapper.inverse_transform_y(transformed_y)
     assert np.allclose(inverse_transformed_y, data_y.reshape(-1, 1))
+
+
+@pytest.mark.order(get_order_number("test_scalers"))
+def test_scaler_banks():
+    rng = np.random.default_rng(0)
+    series_ids = rng.choice(np.array(["a", "b", "c"]), size=90)
+    data_X = rng.normal(size=(90, 2)) * 5 + 3
+    data_X[series_ids == "c", 1] = 7.0
+    data_y = data_X[:, 0]
+
+    for bank_class, wrapper_class in [
+        (MinMaxScalerBank, MinMaxScalerWrapper),
+        (StandardScalerBank, StandardScalerWrapper),
+    ]:
+        bank = bank_class()
+        transformed_X = bank.fit_transform_X(data_X, series_ids)
+        transformed_y = bank.fit_transform_y(data_y.reshape(-1, 1), series_ids)
+        for series in ["a", "b", "c"]:
+            rows = series_ids == series
+            wrapper = wrapper_class()
+            expected_X = wrapper.fit_transform_X(data_X[rows])
+            expected_y = wrapper.fit_transform_y(data_y[rows].reshape(-1, 1))
+            assert np.allclose(transformed_X[rows], expected_X)
+            assert np.allclose(transformed_y[rows], expected_y)
+
+        assert np.allclose(bank.transform_X(data_X, series_ids), transformed_X)
+        assert np.allclose(bank.inverse_transform_X(transformed_X, series_ids), data_X)
+        assert np.allclose(
+            bank.inverse_transform_y(transformed_y, series_ids), data_y[:, None]
+        )
+
+        # Parameters fitted on one column broadcast over windows
+        windows = np.stack([data_y, data_y, data_y], axis=1)
+        assert np.allclose(
+            bank.transform_y(windows, series_ids), np.repeat(transformed_y, 3, axis=1)
+        )
+
+        with pytest.raises(ValueError):
+            bank.transform_X(data_X[:1], ["d"])
+
+
+@pytest.mark.order(get_order_number("test_scalers"))
+def test_partial_fit_scalers():
+    rng = np.random.default_rng(1)
+    data_X = rng.normal(size=(300, 3)) * 4 + 2
+    data_X[:, 2] = 5.0
+    data_y = data_X[:, :1]
+    chunks = np.array_split(np.arange(300), 5)
+
+    for wrapper_class in [MinMaxScalerWrapper, StandardScalerWrapper]:
+        full = wrapper_class()
+        expected_X = full.fit_transform_X(data_X)
+        expected_y = full.fit_transform_y(data_y)
+
+        # Online updates, chunk after chunk
+        online = wrapper_class()
+        for rows in chunks:
+            online.partial_fit_X(data_X[rows]).partial_fit_y(data_y[rows])
+        assert np.allclose(online.transform_X(data_X), expected_X)
+        assert np.allclose(online.transform_y(data_y), expected_y)
+
+        # Workers fitting separate chunks, merged afterwards
+        workers = [
+            wrapper_class().partial_fit_X(data_X[rows]).partial_fit_y(data_y[rows])
+            for rows in chunks
+        ]
+        merged = wrapper_class()
+        for worker in workers:
+            merged.merge(worker)
+        assert merged.scaler_X.n_samples_seen_ == 300
+        assert np.allclose(merged.transform_X(data_X), expected_X)
+        assert np.allclose(
+            merged.inverse_transform_y(merged.transform_y(data_y)), data_y
+        )
+
+
+@pytest.mark.order(get_order_number("test_scalers"))
+def test_scalers_dtype():
+    data = np.arange(20).reshape(10, 2)
+    assert MinMaxScalerWrapper().fit_transform_X(data).dtype == np.float64
+    for scaler_wrapper in [
+        MinMaxScalerWrapper(dtype=np.float32),
+        StandardScalerWrapper(dtype=np.float32),
+    ]:
+        transformed = scaler_wrapper.fit_transform_X(data)
+        assert transformed.dtype == np.float32
+        assert scaler_wrapper.inverse_transform_X(transformed).dtype == np.float32
+
+    bank = StandardScalerBank(dtype=np.float32)
+    assert bank.fit_transform_X(data, np.arange(10) % 2).dtype == np.float32
@@ -1,12 +1,22 @@
 import pytest
 from tests.v1.conftest import get_order_number
+from timepulse.utils.dtypes import set_float_dtype
 from timepulse.utils.splits import (
+    create_multivar_dataframe,
+    create_windowed_dataframe,
     get_labelled_windows,
     make_windows,
     make_train_test_splits,
     make_window_splits,
+    make_multivariate_windows,
+    make_backtest_splits,
+    make_backtest_folds,
+    make_panel_windows,
 )
+from tests.v1.mock_data import multiple_place_daily_mock_data
 import numpy as np
+import warnings
+import pandas as pd
 
 
 @pytest.mark.order(get_order_number("test_splits"))
@@ -71,3 +81,213 @@ def test_splits():
 
     assert train_labels[0].shape == (horizon,)
     assert test_labels[0].shape == (horizon,)
+
+
+@pytest.mark.order(get_order_number("test_splits"))
+def test_strided_windows():
+    x = np.arange(1, 13)
+    full_windows, full_labels = make_windows(x, window_size=5, horizon=2)
+    view_windows, view_labels = make_windows(x, window_size=5, horizon=2, copy=False)
+
+    assert np.array_equal(full_windows, view_windows)
+    assert np.array_equal(full_labels, view_labels)
+    assert np.shares_memory(view_windows, x) and np.shares_memory(view_labels, x)
+    assert not view_windows.flags.writeable and not view_labels.flags.writeable
+
+    train_windows, test_windows, train_labels, test_labels = make_window_splits(
+        x, size=3, horizon=1, copy=False
+    )
+    assert np.shares_memory(train_windows, x) and np.shares_memory(test_labels, x)
+    assert train_windows[0].shape == (3,)
+    assert test_labels[0].shape == (1,)
+
+
+@pytest.mark.order(get_order_number("test_splits"))
+def test_multivariate_windows():
+    x = np.stack([np.arange(10), np.arange(10) * 10, np.arange(10) * 100], axis=1)
+    windows, labels = make_multivariate_windows(
+        x, window_size=4, horizon=2, target_column=1
+    )
+    assert windows.shape == (5, 4, 3)
+    assert labels.shape == (5, 2)
+    assert np.array_equal(windows[1], x[1:5])
+    assert np.array_equal(labels[1], x[5:7, 1])
+    assert np.shares_memory(windows, x) and np.shares_memory(labels, x)
+
+    df = pd.DataFrame(x, columns=["a", "b", "c"])
+    df_windows, df_labels = make_multivariate_windows(
+        df, window_size=4, horizon=2, target_column="b"
+    )
+    assert np.array_equal(df_windows, windows)
+    assert np.array_equal(df_labels, labels)
+
+
+@pytest.mark.order(get_order_number("test_splits"))
+def test_windowed_dataframe():
+    df = pd.DataFrame(
+        {"value": np.arange(10, dtype=np.float64), "holidays": np.arange(10) % 3},
+        index=pd.date_range("2023-01-31", periods=10, freq="M", name="Date"),
+    )
+    windowed_df = create_windowed_dataframe(df, target_column="value", window_size=3)
+    expected_df = df.copy()
+    for i in range(3):
+        expected_df[f"value-{i+1}"] = expected_df["value"].shift(periods=i + 1)
+    pd.testing.assert_frame_equal(windowed_df, expected_df.dropna())
+
+    windowed_df = create_windowed_dataframe(
+        df, target_column=["value", "holidays"], window_size=2, dtype=np.float32
+    )
+    assert list(windowed_df.columns) == [
+        "value",
+        "holidays",
+        "value-1",
+        "value-2",
+        "holidays-1",
+        "holidays-2",
+    ]
+    assert (windowed_df.dtypes == np.float32).all()
+    assert len(windowed_df) == 8
+    assert np.array_equal(windowed_df["holidays-2"], df["holidays"].iloc[:-2])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        create_windowed_dataframe(
+            pd.DataFrame({"value": np.random.random(1000)}), "value", window_size=200
+        )
+
+
+@pytest.mark.order(get_order_number("test_splits"))
+def test_multivar_dataframe():
+    dates = pd.date_range("2023-01-31", periods=6, freq="M", name="Date")
+    base_df = pd.DataFrame({"value": np.arange(6.0)}, index=dates)
+    holidays_df = pd.DataFrame({"total_holidays": [2.0, 1.0, 3.0]}, index=dates[1:4])
+    stringency_df = pd.DataFrame({"stringency_category": [1, 2]}, index=dates[:2])
+
+    multivar_df = create_multivar_dataframe(base_df, holidays_df, stringency_df)
+    assert list(multivar_df.columns) == [
+        "value",
+        "total_holidays",
+        "stringency_category",
+    ]
+    assert list(multivar_df["total_holidays"]) == [0, 2, 1, 3, 0, 0]
+    assert list(multivar_df["stringency_category"]) == [1, 2, 0, 0, 0, 0]
+    assert (multivar_df.dtypes[1:] == int).all()
+
+    multivar_df = create_multivar_dataframe(
+        base_df,
+        holidays_df,
+        stringency_df,
+        fill_value={"total_holidays": -1, "stringency_category": "ffill"},
+        dtype={"total_holidays": np.float32},
+    )
+    assert list(multivar_df["total_holidays"]) == [-1, 2, 1, 3, -1, -1]
+    assert multivar_df["total_holidays"].dtype == np.float32
+    assert list(multivar_df["stringency_category"]) == [1, 2, 2, 2, 2, 2]
+
+    # Weekly readings matched to the last one at or before every month end
+    weather_df = pd.DataFrame(
+        {"temperature": np.arange(20.0)},
+        index=pd.date_range("2023-01-01", periods=20, freq="W"),
+    )
+    multivar_df = create_multivar_dataframe(base_df, weather_df, asof=True, dtype=None)
+    expected = [weather_df.loc[:date, "temperature"].iloc[-1] for date in dates]
+    assert list(multivar_df["temperature"]) == expected
+    multivar_df = create_multivar_dataframe(
+        base_df,
+        weather_df,
+        asof=True,
+        tolerance=pd.Timedelta(days=3),
+        fill_value=None,
+        dtype=None,
+    )
+    assert multivar_df["temperature"].isna().any()
+
+
+@pytest.mark.order(get_order_number("test_splits"))
+def test_backtest_splits():
+    splits = list(make_backtest_splits(10, train_size=4, horizon=2, step=2, gap=1))
+    assert splits == [(slice(0, 4), slice(5, 7)), (slice(0, 6), slice(7, 9))]
+
+    splits = list(
+        make_backtest_splits(10, train_size=4, horizon=2, step=1, expanding=False)
+    )
+    assert len(splits) == 5
+    assert all(train.stop - train.start == 4 for train, _ in splits)
+    assert splits[-1] == (slice(4, 8), slice(8, 10))
+    assert list(
+        make_backtest_splits(10, train_size=4, horizon=2, step=1, n_folds=2)
+    ) == [(slice(0, 7), slice(7, 9)), (slice(0, 8), slice(8, 10))]
+    assert list(make_backtest_splits(5, train_size=4, horizon=2)) == []
+    with pytest.raises(ValueError):
+        list(make_backtest_splits(10, train_size=4, horizon=0))
+
+    windows, labels = make_windows(np.arange(30), window_size=5, horizon=1)
+    folds = list(make_backtest_folds(windows, labels, train_size=10, horizon=3, gap=1))
+    assert len(folds) == 4
+    for train_windows, test_windows, train_labels, test_labels in folds:
+        assert np.shares_memory(train_windows, windows)
+        assert np.shares_memory(test_labels, labels)
+        assert len(test_windows) == len(test_labels) == 3
+        assert test_windows[0, 0] == train_windows[-1, 0] + 2
+
+
+@pytest.mark.order(get_order_number("test_splits"))
+def test_panel_windows():
+    shuffled_df = multiple_place_daily_mock_data.sample(frac=1, random_state=0)
+    windows, labels, series_ids = make_panel_windows(
+        shuffled_df, "place", "date", "value", window_size=5, horizon=2
+    )
+    assert windows.flags.c_contiguous and labels.flags.c_contiguous
+
+    expected_windows, expected_labels, expected_ids = [], [], []
+    for place in ["A", "B", "C"]:
+        place_df = multiple_place_daily_mock_data[
+            multiple_place_daily_mock_data["place"] == place
+        ].sort_values("date")
+        place_windows, place_labels = make_windows(
+            place_df["value"].to_numpy(), window_size=5, horizon=2
+        )
+        expected_windows.append(place_windows)
+        expected_labels.append(place_labels)
+        expected_ids += [place] * len(place_windows)
+    assert np.array_equal(windows, np.concatenate(expected_windows))
+    assert np.array_equal(labels, np.concatenate(expected_labels))
+    assert list(series_ids) == expected_ids
+
+    windows, labels, series_ids = make_panel_windows(
+        shuffled_df.iloc[:3], "place", "date", "value", window_size=5, horizon=2
+    )
+    assert windows.shape == (0, 5) and labels.shape == (0, 2) and len(series_ids) == 0
+
+
+@pytest.mark.order(get_order_number("test_splits"))
+def test_float_dtype_policy():
+    series = np.arange(50)
+    assert make_windows(series, window_size=5)[0].dtype == series.dtype
+    windows, labels = make_windows(series, window_size=5, dtype=np.float32)
+    assert windows.dtype == labels.dtype == np.float32
+
+    set_float_dtype(np.float32)
+    try:
+        train_windows, test_windows, train_labels, test_labels = make_window_splits(
+            series, size=5
+        )
+        assert train_windows.dtype == test_labels.dtype == np.float32
+        windows, labels = make_multivariate_windows(
+            np.stack([series, series], axis=1), window_size=5
+        )
+        assert windows.dtype == labels.dtype == np.float32
+        # The call overrides the global dtype
+        assert (
+            make_windows(series, window_size=5, dtype=np.float64)[0].dtype == np.float64
+        )
+        windowed_df = create_windowed_dataframe(
+            pd.DataFrame({"value": series}), target_column="value"
+        )
+        assert (windowed_df.dtypes == np.float32).all()
+    finally:
+        set_float_dtype(None)
+    assert make_windows(series, window_size=5)[0].dtype == series.dtype
+
+    with pytest.raises(ValueError):
+        set_float_dtype(int)
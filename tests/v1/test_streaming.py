@@ -0,0 +1,37 @@
+import pytest
+from tests.v1.conftest import get_order_number
+from timepulse.utils.streaming import StreamingWindower
+from timepulse.utils.splits import make_windows
+import numpy as np
+
+
+@pytest.mark.order(get_order_number("test_streaming"))
+def test_streaming():
+    x = np.arange(20, dtype=np.float32)
+    windower = StreamingWindower(window_size=5)
+    windows, _ = make_windows(x, window_size=5, horizon=1)
+    for t, value in enumerate(x):
+        windower.push(value)
+        if t < 4:
+            assert not windower.is_ready(0)
+            with pytest.raises(ValueError):
+                windower.current_window()
+        elif t < len(windows):
+            assert np.array_equal(windower.current_window(), windows[t - 4])
+    assert np.array_equal(windower.current_window(), x[-5:])
+    assert not windower.current_window().flags.writeable
+
+    # Many series pushed at once with exogenous features
+    n_series, n_steps = 1000, 12
+    values = np.random.random((n_series, n_steps)).astype(np.float32)
+    exog = np.random.random((n_series, n_steps, 2)).astype(np.float32)
+    windower = StreamingWindower(window_size=4, n_series=n_series, n_exog=2)
+    for t in range(n_steps):
+        windower.push_many(values[:, t], exog[:, t])
+    expected = np.concatenate([values[:, -4:, None], exog[:, -4:]], axis=2)
+    assert np.array_equal(windower.current_windows(), expected)
+    assert np.array_equal(windower.current_window(series=7), expected[7])
+
+    windower.push_many(np.zeros(2), np.ones((2, 2)), series=[0, 5])
+    assert windower.current_windows(series=[0, 5])[:, -1, 0].tolist() == [0, 0]
+    assert windower.current_windows(series=[1])[0, -1, 0] == values[1, -1]
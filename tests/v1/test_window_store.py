@@ -0,0 +1,52 @@
+import pytest
+from tests.v1.conftest import get_order_number
+from timepulse.utils.window_store import WindowStore, save_window_store
+from timepulse.utils.splits import make_window_splits, make_windows
+from timepulse.models.nn import MultivariateDense
+import numpy as np
+
+
+@pytest.mark.order(get_order_number("test_window_store"))
+def test_window_store(tmp_path):
+    values = np.sin(np.arange(200) / 10)
+    store = save_window_store(
+        str(tmp_path / "store"), values, window_size=10, horizon=2, dtype=np.float32
+    )
+    assert isinstance(store.values, np.memmap)
+    assert store.values.dtype == np.float32
+
+    # Another process would open the same file the same way
+    store = WindowStore(str(tmp_path / "store"))
+    windows, labels = store.windows()
+    expected_windows, expected_labels = make_windows(
+        values.astype(np.float32), window_size=10, horizon=2
+    )
+    assert np.array_equal(windows, expected_windows)
+    assert np.array_equal(labels, expected_labels)
+    assert np.shares_memory(windows, store.values)
+    assert not windows.flags.writeable
+
+    X_train, X_test, y_train, y_test = store.train_test_splits(test_split=0.2)
+    expected_splits = make_window_splits(values.astype(np.float32), size=10, horizon=2)
+    assert len(X_train) + len(X_test) == len(expected_windows)
+    assert np.shares_memory(X_test, store.values)
+    assert np.array_equal(X_train[0], expected_splits[0][0])
+
+    multivariate_store = save_window_store(
+        str(tmp_path / "multivariate"),
+        np.stack([values, values * 2], axis=1),
+        window_size=10,
+        horizon=1,
+        target_column=1,
+    )
+    windows, labels = multivariate_store.windows()
+    assert windows.shape == (190, 10, 2)
+    assert np.array_equal(labels[:, 0], values[10:] * 2)
+
+    train_dataset, test_dataset = WindowStore(str(tmp_path / "store")).datasets(
+        batch_size=32
+    )
+    model_instance = MultivariateDense(horizon=2, epochs=1, scaler_class=None)
+    model_instance.build()
+    model_instance.compile()
+    model_instance.fit(train_dataset, X_val=test_dataset)
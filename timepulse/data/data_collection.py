@@ -1,11 +1,316 @@
+import numpy as np
 import pandas as pd
-import re, os
+import re, os, time, hashlib, tempfile
 import holidays
-from typing import Literal, List
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Literal, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import urlopen
+
+STRINGENCY_INDEX_AVG_URL = "https://raw.githubusercontent.com/OxCGRT/covid-policy-tracker/master/data/timeseries/stringency_index_avg.csv"
+STRINGENCY_INDEX_SNAPSHOT = "stringency_index_avg.npz"
+# Seconds a cached snapshot is considered fresh before it is downloaded again
+STRINGENCY_INDEX_CACHE_TTL = 24 * 60 * 60
+# Rows of the csv parsed at a time when streaming it
+STRINGENCY_INDEX_CHUNKSIZE = 64
+# Number of (country, years) holiday calendars kept in memory
+HOLIDAY_CALENDAR_CACHE_SIZE = 256
+# Bumped whenever the layout of the snapshot arrays changes
+_SNAPSHOT_VERSION = 1
+
+
+def _snapshot_checksum(
+    country_names: np.ndarray, date_columns: np.ndarray, values: np.ndarray
+) -> str:
+    digest = hashlib.sha256()
+    digest.update("\x1f".join(country_names).encode("utf-8"))
+    digest.update("\x1f".join(date_columns).encode("utf-8"))
+    digest.update(np.ascontiguousarray(values).tobytes())
+    return digest.hexdigest()
+
+
+def _parse_stringency_csv(
+    path_or_url: str,
+    countries: Optional[List[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    chunksize: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parses the wide OxCGRT csv into country names, date columns and a float32 value matrix.
+
+    Only the "country_name" column and the date columns between `start` and `end` are
+    parsed. With `chunksize` the file is streamed in blocks of rows and rows of other
+    countries are dropped block by block, so the full table is never held in memory.
+    """
+    # Define a regular expression pattern to match the date format
+    date_pattern = r"(\d{2})([A-Za-z]{3})(\d{4})"
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+
+    def is_wanted_column(col: str) -> bool:
+        if col == "country_name":
+            return True
+        if not re.fullmatch(date_pattern, col):
+            return False
+        date = datetime.strptime(col, "%d%b%Y")
+        return (start is None or date >= start) and (end is None or date <= end)
+
+    read_kwargs = dict(
+        usecols=is_wanted_column,
+        dtype=defaultdict(lambda: np.float32, country_name=str),
+        chunksize=chunksize,
+    )
+    if urlparse(path_or_url).scheme in ("http", "https"):
+        # Hand the open response to pandas so chunks are parsed while downloading
+        with urlopen(path_or_url) as response:
+            chunks = _read_stringency_chunks(response, countries, **read_kwargs)
+    else:
+        chunks = _read_stringency_chunks(path_or_url, countries, **read_kwargs)
+    strigency_index_df = pd.concat(chunks)
+
+    if "country_name" not in strigency_index_df.columns:
+        raise ValueError(f"{path_or_url} has no 'country_name' column")
+    date_columns = [col for col in strigency_index_df.columns if col != "country_name"]
+    if not date_columns and start is None and end is None:
+        raise ValueError(f"{path_or_url} has no date columns")
+
+    country_names = strigency_index_df["country_name"].astype(str).to_numpy(dtype=str)
+    values = strigency_index_df[date_columns].to_numpy(dtype=np.float32)
+    return country_names, np.array(date_columns, dtype=str), values
+
+
+def _read_stringency_chunks(
+    source, countries: Optional[List[str]], chunksize: Optional[int], **kwargs
+) -> List[pd.DataFrame]:
+    if chunksize is None:
+        chunks = [pd.read_csv(source, **kwargs)]
+    else:
+        chunks = pd.read_csv(source, chunksize=chunksize, **kwargs)
+    if countries is None:
+        return list(chunks)
+    return [
+        (
+            chunk[chunk["country_name"].isin(countries)]
+            if "country_name" in chunk.columns
+            else chunk
+        )
+        for chunk in chunks
+    ]
+
+
+def _select_stringency(
+    country_names: np.ndarray,
+    date_columns: np.ndarray,
+    values: np.ndarray,
+    countries: Optional[List[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Applies the country and date range filters of `_parse_stringency_csv` to a loaded table.
+    """
+    if countries is not None:
+        rows = np.isin(country_names, countries)
+        country_names, values = country_names[rows], values[rows]
+    if start is not None or end is not None:
+        dates = pd.to_datetime(date_columns, format="%d%b%Y")
+        columns = np.ones(len(dates), dtype=bool)
+        if start is not None:
+            columns &= dates >= pd.Timestamp(start)
+        if end is not None:
+            columns &= dates <= pd.Timestamp(end)
+        date_columns, values = date_columns[columns], values[:, columns]
+    return country_names, date_columns, values
+
+
+def _save_snapshot(
+    path: str, country_names: np.ndarray, date_columns: np.ndarray, values: np.ndarray
+) -> None:
+    """
+    Writes the parsed stringency table atomically, so concurrent readers never see a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(
+                f,
+                version=np.array(_SNAPSHOT_VERSION),
+                country_names=country_names,
+                date_columns=date_columns,
+                values=values,
+                checksum=np.array(
+                    _snapshot_checksum(country_names, date_columns, values)
+                ),
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _load_snapshot(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Loads a snapshot written by `_save_snapshot` and raises ValueError if its content is invalid.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as snapshot:
+            version = int(snapshot["version"])
+            country_names = snapshot["country_names"]
+            date_columns = snapshot["date_columns"]
+            values = snapshot["values"]
+            checksum = str(snapshot["checksum"])
+    except (OSError, KeyError, EOFError) as e:
+        raise ValueError(f"Unreadable stringency index snapshot {path}: {e}") from e
+
+    if version != _SNAPSHOT_VERSION:
+        raise ValueError(f"Snapshot {path} has version {version}")
+    if values.shape != (len(country_names), len(date_columns)):
+        raise ValueError(f"Snapshot {path} has inconsistent array shapes")
+    if checksum != _snapshot_checksum(country_names, date_columns, values):
+        raise ValueError(f"Snapshot {path} failed checksum validation")
+    return country_names, date_columns, values
+
+
+def load_stringency_table(
+    cache_dir: Optional[str] = None,
+    cache_ttl: Optional[float] = STRINGENCY_INDEX_CACHE_TTL,
+    local_path: Optional[str] = None,
+    countries: Optional[List[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    chunksize: Optional[int] = STRINGENCY_INDEX_CHUNKSIZE,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Loads the OxCGRT stringency index table from a local file, the on-disk cache or the network.
+
+    Parameters:
+    - cache_dir (str, optional): Directory holding the cached snapshot. Defaults to the
+    TIMEPULSE_CACHE_DIR environment variable; when neither is set nothing is cached.
+    - cache_ttl (float, optional): Age in seconds after which the snapshot is downloaded
+    again. None keeps the snapshot forever. Defaults to one day.
+    - local_path (str, optional): Offline mode. Reads this csv or `.npz` snapshot and never
+    touches the network or the cache.
+    - countries (List[str], optional): Keep only the rows of these countries. Defaults to all.
+    - start, end (str, optional): Keep only the date columns within this inclusive range.
+    - chunksize (int, optional): Number of csv rows parsed at a time when reading a csv
+    without caching. None parses the file in one go. Defaults to 64.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray, np.ndarray]: Country name per row, the date column labels
+    (e.g. "01Jan2020") and the float32 value matrix of shape (rows, dates).
+
+    Example:
+    >>> country_names, date_columns, values = load_stringency_table(cache_dir="storage")
+    >>> load_stringency_table(countries=["Italy"], start="2021-01-01", end="2021-12-31")
+    """
+    if local_path is not None:
+        if local_path.endswith(".npz"):
+            return _select_stringency(
+                *_load_snapshot(local_path), countries=countries, start=start, end=end
+            )
+        return _parse_stringency_csv(local_path, countries, start, end, chunksize)
+
+    if cache_dir is None:
+        cache_dir = os.environ.get("TIMEPULSE_CACHE_DIR")
+    if cache_dir is None:
+        return _parse_stringency_csv(
+            STRINGENCY_INDEX_AVG_URL, countries, start, end, chunksize
+        )
+
+    snapshot_path = os.path.join(
+        os.path.expanduser(cache_dir), STRINGENCY_INDEX_SNAPSHOT
+    )
+    table = None
+    if os.path.exists(snapshot_path):
+        age = time.time() - os.path.getmtime(snapshot_path)
+        if cache_ttl is None or age <= cache_ttl:
+            try:
+                table = _load_snapshot(snapshot_path)
+            except ValueError:
+                # A corrupt or outdated snapshot is treated as a cache miss
+                pass
+
+    if table is None:
+        # The snapshot serves every later request, so the whole file is kept
+        table = _parse_stringency_csv(STRINGENCY_INDEX_AVG_URL)
+        _save_snapshot(snapshot_path, *table)
+    return _select_stringency(*table, countries=countries, start=start, end=end)
+
+
+def _stringency_dates(date_columns: np.ndarray) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    """
+    Converts the date column labels once and returns them sorted along with the sorting order.
+    """
+    dates = pd.to_datetime(date_columns, format="%d%b%Y")
+    order = np.argsort(dates.values, kind="stable")
+    return dates[order], order
+
+
+def _categorise_stringency(
+    values: np.ndarray, dates: pd.DatetimeIndex, period: Literal["D", "M"]
+) -> pd.DataFrame:
+    """
+    Bins the stringency rows of one country and resamples them to the most frequent category.
+
+    `values` has one row per country or region record and one column per entry of the sorted
+    `dates`. The mode of every period is taken with a single bincount over (period, category)
+    pairs; ties resolve to the lowest category, like `Series.mode().iloc[0]`.
+    """
+    # Define bin edges and labels
+    bin_edges = [-1, 33.0, 66.0, 110.0]  # Example boundaries for low, medium, high
+    bin_labels = [0, 1, 2]
+
+    if values.size == 0:
+        return pd.DataFrame(
+            {
+                "stringency_category": pd.Categorical(
+                    [], categories=bin_labels, ordered=True
+                )
+            },
+            index=pd.DatetimeIndex([], name="Date", freq=period),
+        )
+
+    values = np.nan_to_num(values, nan=0.0)
+    # Category code per (row, date), -1 outside of the bins
+    codes = pd.cut(values.ravel(), bins=bin_edges, labels=False)
+    codes = np.nan_to_num(codes, nan=-1).astype(np.int64).reshape(values.shape)
+
+    # Position of every date within the resampled periods
+    ordinals = dates.to_period(period).asi8
+    buckets = np.broadcast_to(ordinals - ordinals[0], values.shape)
+    n_buckets = ordinals[-1] - ordinals[0] + 1
+
+    valid = codes >= 0
+    counts = np.bincount(
+        buckets[valid] * len(bin_labels) + codes[valid],
+        minlength=n_buckets * len(bin_labels),
+    ).reshape(n_buckets, len(bin_labels))
+
+    first_label = dates[:1].to_period(period).to_timestamp(how="end").normalize()[0]
+    return pd.DataFrame(
+        {"stringency_category": np.asarray(bin_labels)[counts.argmax(axis=1)]},
+        index=pd.date_range(
+            start=first_label, periods=n_buckets, freq=period, name="Date"
+        ),
+    )
 
 
 def fetch_stringency_index(
-    country: str, period: Literal["D", "M"] = "M"
+    country: str,
+    period: Literal["D", "M"] = "M",
+    cache_dir: Optional[str] = None,
+    cache_ttl: Optional[float] = STRINGENCY_INDEX_CACHE_TTL,
+    local_path: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    chunksize: Optional[int] = STRINGENCY_INDEX_CHUNKSIZE,
 ) -> pd.DataFrame:
     """
     Fetches and processes stringency index data for the specified country and period.
@@ -15,54 +320,176 @@ def fetch_stringency_index(
     stringency index data is fetched.
     - period (Literal["D", "M"], optional): The time period for data resampling,
     either "D" for daily or "M" for monthly. Defaults to "M".
+    - cache_dir (str, optional): Directory for the on-disk snapshot of the source file.
+    Defaults to the TIMEPULSE_CACHE_DIR environment variable; no caching when unset.
+    - cache_ttl (float, optional): Seconds before a cached snapshot is refreshed. Defaults to one day.
+    - local_path (str, optional): Offline mode, reads this csv or `.npz` snapshot instead of downloading.
+    - start, end (str, optional): Only use the dates within this inclusive range. Defaults to all dates.
+    - chunksize (int, optional): Rows parsed at a time when streaming the csv, so rows of other
+    countries are dropped early. None parses the whole file at once. Defaults to 64.
 
     Returns:
     - pd.DataFrame: Processed DataFrame containing the stringency index data with date-wise categories.
 
     Example:
     >>> fetch_stringency_index("Italy")
+    >>> fetch_stringency_index("Italy", cache_dir="~/.cache/timepulse")
+    >>> fetch_stringency_index("Italy", local_path="data/stringency_index_avg.csv")
     """
-    stringency_index_avg_url = "https://raw.githubusercontent.com/OxCGRT/covid-policy-tracker/master/data/timeseries/stringency_index_avg.csv"
-    strigency_index_df = pd.read_csv(stringency_index_avg_url)
-    strigency_index_df = strigency_index_df[
-        strigency_index_df["country_name"] == country
-    ]
-
-    # Define a regular expression pattern to match the date format
-    date_pattern = r"(\d{2})([A-Za-z]{3})(\d{4})"
-    date_columns = [
-        col for col in strigency_index_df.columns if re.fullmatch(date_pattern, col)
-    ]
+    country_names, date_columns, values = load_stringency_table(
+        cache_dir=cache_dir,
+        cache_ttl=cache_ttl,
+        local_path=local_path,
+        countries=[country],
+        start=start,
+        end=end,
+        chunksize=chunksize,
+    )
+    dates, order = _stringency_dates(date_columns)
+    return _categorise_stringency(
+        values[country_names == country][:, order], dates, period
+    )
 
-    strigency_index_df = strigency_index_df[date_columns]
-    strigency_index_df = strigency_index_df.fillna(0)
 
-    strigency_index_df = pd.melt(
-        strigency_index_df, id_vars=None, var_name="Date", value_name="stringency_index"
-    )
+def fetch_stringency_indexes(
+    countries: List[str],
+    period: Literal["D", "M"] = "M",
+    cache_dir: Optional[str] = None,
+    cache_ttl: Optional[float] = STRINGENCY_INDEX_CACHE_TTL,
+    local_path: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    chunksize: Optional[int] = STRINGENCY_INDEX_CHUNKSIZE,
+) -> pd.DataFrame:
+    """
+    Fetches and processes stringency index data for several countries from a single parse.
 
-    strigency_index_df["Date"] = pd.to_datetime(
-        strigency_index_df["Date"], format="%d%b%Y"
-    ).dt.strftime("%Y-%m-%d")
-    strigency_index_df["Date"] = pd.to_datetime(strigency_index_df["Date"])
+    The source file is loaded and its date columns are converted once, then every country
+    is processed exactly like `fetch_stringency_index`.
 
-    strigency_index_df = strigency_index_df.sort_values(by="Date")
-    strigency_index_df = strigency_index_df.set_index("Date")
+    Parameters:
+    - countries (List[str]): The names of the countries for which the stringency index data is fetched.
+    - period (Literal["D", "M"], optional): The time period for data resampling,
+    either "D" for daily or "M" for monthly. Defaults to "M".
+    - cache_dir, cache_ttl, local_path, start, end, chunksize: See `fetch_stringency_index`.
 
-    # Define bin edges and labels
-    bin_edges = [-1, 33.0, 66.0, 110.0]  # Example boundaries for low, medium, high
-    bin_labels = [0, 1, 2]
+    Returns:
+    - pd.DataFrame: Panel with a ("country", "Date") MultiIndex and a "stringency_category" column.
+    Countries missing from the source have no rows.
 
-    strigency_index_df["stringency_category"] = pd.cut(
-        strigency_index_df["stringency_index"], bins=bin_edges, labels=bin_labels
+    Example:
+    >>> panel_df = fetch_stringency_indexes(["Italy", "Spain"])
+    >>> italy_df = panel_df.xs("Italy", level="country")
+    """
+    country_names, date_columns, values = load_stringency_table(
+        cache_dir=cache_dir,
+        cache_ttl=cache_ttl,
+        local_path=local_path,
+        countries=countries,
+        start=start,
+        end=end,
+        chunksize=chunksize,
     )
+    dates, order = _stringency_dates(date_columns)
+    values = values[:, order]
 
-    strigency_index_df = strigency_index_df.resample(period).agg(
-        {"stringency_category": lambda x: x.mode().iloc[0]}
+    country_masks = {country: country_names == country for country in countries}
+    country_dfs = {
+        country: _categorise_stringency(values[mask], dates, period)
+        for country, mask in country_masks.items()
+        if mask.any()
+    }
+    if not country_dfs:
+        empty_index = pd.MultiIndex.from_arrays(
+            [pd.Index([], dtype=object), pd.DatetimeIndex([])],
+            names=["country", "Date"],
+        )
+        return pd.DataFrame({"stringency_category": []}, index=empty_index, dtype=int)
+    return pd.concat(country_dfs, names=["country", "Date"])
+
+
+@lru_cache(maxsize=HOLIDAY_CALENDAR_CACHE_SIZE)
+def _holiday_calendar(
+    country_code: str, years: Tuple[int, ...]
+) -> Tuple[np.datetime64, np.ndarray]:
+    holiday_dates = np.array(
+        sorted(holidays.country_holidays(country_code, years=list(years)).keys()),
+        dtype="datetime64[D]",
     )
-    strigency_index_df = strigency_index_df.fillna(0)
+    if len(holiday_dates) == 0:
+        return np.datetime64("NaT", "D"), np.zeros(0, dtype=np.uint8)
+
+    offsets = (holiday_dates - holiday_dates[0]).astype(np.int64)
+    bitmap = np.zeros(offsets[-1] + 1, dtype=np.uint8)
+    bitmap[offsets] = 1
+    # The arrays are shared by every caller of the cache
+    bitmap.setflags(write=False)
+    return holiday_dates[0], bitmap
+
+
+def holiday_calendar(
+    country_code: str, years: List[int]
+) -> Tuple[np.datetime64, np.ndarray]:
+    """
+    Returns the daily holiday bitmap of a country, computed once per (country, years).
+
+    Results are kept in an in-process LRU cache of HOLIDAY_CALENDAR_CACHE_SIZE entries.
+
+    Parameters:
+    - country_code (str): The country code for the country of interest.
+    - years (List[int]): The years for which holidays are looked up, in any order.
+
+    Returns:
+    - Tuple[np.datetime64, np.ndarray]: The date of the first holiday and a read-only uint8
+    array with one entry per day from the first to the last holiday, 1 on holidays.
+
+    Example:
+    >>> first_date, bitmap = holiday_calendar("IT", [2021, 2022])
+    """
+    return _holiday_calendar(country_code, tuple(sorted({int(year) for year in years})))
+
 
-    return strigency_index_df
+def _aggregate_holidays(
+    first_date: np.datetime64, bitmap: np.ndarray, period: Literal["D", "M"]
+) -> pd.DataFrame:
+    """
+    Sums a holiday bitmap per day or month without going through a resample.
+    """
+    if len(bitmap) == 0:
+        return pd.DataFrame(
+            {"total_holidays": np.zeros(0)},
+            index=pd.DatetimeIndex([], name="Date", freq=period),
+        )
+
+    if period == "D":
+        return pd.DataFrame(
+            {"total_holidays": bitmap.astype(np.int64)},
+            index=pd.date_range(first_date, periods=len(bitmap), freq="D", name="Date"),
+        )
+
+    if period == "M":
+        last_date = first_date + (len(bitmap) - 1)
+        months = np.arange(
+            first_date.astype("datetime64[M]"), last_date.astype("datetime64[M]") + 1
+        )
+        # Offset of the first day of every month within the bitmap
+        month_starts = (months.astype("datetime64[D]") - first_date).astype(np.int64)
+        month_starts[0] = 0
+        return pd.DataFrame(
+            {"total_holidays": np.add.reduceat(bitmap, month_starts, dtype=np.int64)},
+            index=pd.date_range(
+                (months[0] + 1).astype("datetime64[D]") - 1,
+                periods=len(months),
+                freq="M",
+                name="Date",
+            ),
+        )
+
+    holidays_df = pd.DataFrame(
+        {"total_holidays": bitmap.astype(np.int64)},
+        index=pd.date_range(first_date, periods=len(bitmap), freq="D", name="Date"),
+    )
+    return holidays_df.resample(period).sum()
 
 
 def fetch_holidays(
@@ -83,13 +510,62 @@ def fetch_holidays(
     Example:
     >>> fetch_holidays([2021, 2022], "IT")
     """
-    holidays_dict = holidays.country_holidays(country_code, years=years)
-    holidays_df = pd.DataFrame(
-        {"total_holidays": [1 for _ in range(len(holidays_dict.keys()))]},
-        index=holidays_dict.keys(),
+    return _aggregate_holidays(*holiday_calendar(country_code, years), period)
+
+
+def fetch_holidays_panel(
+    years: List[int], country_codes: List[str], period: Literal["D", "M"] = "M"
+) -> pd.DataFrame:
+    """
+    Fetches and processes holidays data for several countries into one panel.
+
+    Parameters:
+    - years (List): A list of years for which holidays data is fetched.
+    - country_codes (List[str]): The country codes for the countries of interest.
+    - period (Literal["D", "M"], optional): The time period for data resampling, either "D" for daily or "M" for monthly.
+                                             Defaults to "M".
+
+    Returns:
+    - pd.DataFrame: Panel with a ("country", "Date") MultiIndex and a "total_holidays" column,
+    each country covering the same dates as `fetch_holidays` would return for it.
+
+    Example:
+    >>> panel_df = fetch_holidays_panel([2021, 2022], ["IT", "ES"])
+    >>> italy_df = panel_df.xs("IT", level="country")
+    """
+    return pd.concat(
+        {
+            country_code: fetch_holidays(years, country_code, period)
+            for country_code in country_codes
+        },
+        names=["country", "Date"],
     )
-    holidays_df.index.name = "Date"
-    holidays_df.index = pd.to_datetime(holidays_df.index)
-    holidays_df = holidays_df.resample(period).agg({"total_holidays": "sum"})
-    holidays_df = holidays_df.fillna(0)
-    return holidays_df
+
+
+def prefetch_sources(
+    *sources: Callable[[], pd.DataFrame], max_workers: Optional[int] = None
+) -> List[Future]:
+    """
+    Starts fetching all exogenous sources concurrently on a thread pool.
+
+    Parameters:
+    - sources (Callable[[], pd.DataFrame]): Zero-argument callables returning a DataFrame,
+    e.g. `functools.partial(fetch_holidays, years, "IT")`.
+    - max_workers (int, optional): Maximum number of concurrent fetches. Defaults to one per source.
+
+    Returns:
+    - List[Future]: One future per source, in the given order. They can be passed directly to
+    `create_multivar_dataframe`, which waits for each of them.
+
+    Example:
+    >>> holidays_future, stringency_future = prefetch_sources(
+    ...     partial(fetch_holidays, [2021, 2022], "IT"),
+    ...     partial(fetch_stringency_index, "Italy"),
+    ... )
+    >>> multivar_df = create_multivar_dataframe(df, stringency_future, holidays_future)
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers or max(len(sources), 1))
+    futures = [executor.submit(source) for source in sources]
+    # Already submitted fetches keep running, the threads exit once they are done
+    executor.shutdown(wait=False)
+    return futures
@@ -0,0 +1,345 @@
+import numpy as np
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Same fuzz factor as tf.keras.backend.epsilon()
+EPSILON = 1e-7
+
+
+class MetricInputs:
+    """
+    True and predicted values with the intermediates shared by the metrics.
+
+    Each intermediate is computed on first use and reused by every metric evaluated on the
+    same inputs, e.g. `abs_errors` is built once for MAE, MAPE, SMAPE and MASE.
+    """
+
+    def __init__(self, y_true: np.array, y_pred: np.array) -> None:
+        self.y_true = y_true
+        self.y_pred = y_pred
+
+    @cached_property
+    def errors(self) -> np.array:
+        return self.y_pred - self.y_true
+
+    @cached_property
+    def abs_errors(self) -> np.array:
+        return np.abs(self.errors)
+
+    @cached_property
+    def squared_errors(self) -> np.array:
+        return np.square(self.errors)
+
+    @cached_property
+    def abs_true(self) -> np.array:
+        return np.abs(self.y_true)
+
+
+METRICS: Dict[str, Callable[[MetricInputs], float]] = {}
+
+
+def register_metric(
+    name: str,
+    func: Optional[Callable[[MetricInputs], float]] = None,
+    overwrite: bool = False,
+):
+    """
+    Registers a metric computed from `MetricInputs`, so `evaluate_preds` can select it by name.
+
+    Can be used as a decorator.
+
+    Parameters
+    ----------
+    name : str
+        Name of the metric, the key of its value in the results.
+
+    func : Callable[[MetricInputs], float]
+        Function computing the metric from the shared intermediates.
+
+    overwrite : bool, optional, default: False
+        Whether to replace a metric registered under the same name.
+
+    Example
+    -------
+    @register_metric("max_error")
+    def max_error(inputs):
+        return np.max(inputs.abs_errors)
+
+    evaluate_preds(y_true, y_pred, metrics=["mae", "max_error"])
+    """
+
+    def register(func: Callable[[MetricInputs], float]):
+        if name in METRICS and not overwrite:
+            raise ValueError(f"Metric {name!r} is already registered")
+        METRICS[name] = func
+        return func
+
+    return register if func is None else register(func)
+
+
+@register_metric("mae")
+def _mae(inputs: MetricInputs) -> float:
+    return np.mean(inputs.abs_errors, axis=-1)
+
+
+@register_metric("mse")
+def _mse(inputs: MetricInputs) -> float:
+    return np.mean(inputs.squared_errors, axis=-1)
+
+
+@register_metric("rmse")
+def _rmse(inputs: MetricInputs) -> float:
+    return np.sqrt(_mse(inputs))
+
+
+@register_metric("mape")
+def _mape(inputs: MetricInputs) -> float:
+    diff = inputs.abs_errors / np.maximum(inputs.abs_true, EPSILON)
+    return np.float32(100.0) * np.mean(diff, axis=-1)
+
+
+@register_metric("smape")
+def _smape(inputs: MetricInputs) -> float:
+    denominator = (np.abs(inputs.y_pred) + inputs.abs_true) / 2
+    mask = denominator != 0
+    if np.any(mask):
+        smape = np.mean(200 * np.divide(inputs.abs_errors[mask], denominator[mask]))
+        return 0.0 if np.isnan(smape) else smape
+    else:
+        return 0.0
+
+
+@register_metric("mase")
+def _mase(inputs: MetricInputs) -> float:
+    mae = np.mean(inputs.abs_errors)
+    mae_naive_no_season = np.mean(np.abs(inputs.y_true[1:] - inputs.y_true[:-1]))
+    if mae_naive_no_season == 0:
+        return 0.0
+    else:
+        return mae / (mae_naive_no_season + EPSILON)
+
+
+@register_metric("r2_score")
+def _r2(inputs: MetricInputs) -> float:
+    total_error = np.sum(np.square(inputs.y_true - np.mean(inputs.y_true)))
+    unexplained_error = np.sum(inputs.squared_errors)
+    return np.float32(1) - unexplained_error / (total_error + np.float32(EPSILON))
+
+
+# The built-in metrics, returned by default
+METRIC_NAMES = list(METRICS)
+METRICS_DTYPE = np.dtype([(name, np.float64) for name in METRIC_NAMES])
+
+
+def calculate_mae(y_true: np.array, y_pred: np.array) -> float:
+    """Calculate Mean Absolute Error."""
+    return _mae(MetricInputs(y_true, y_pred))
+
+
+def calculate_mse(y_true: np.array, y_pred: np.array) -> float:
+    """Calculate Mean Squared Error."""
+    return _mse(MetricInputs(y_true, y_pred))
+
+
+def calculate_rmse(y_true: np.array, y_pred: np.array) -> float:
+    """Calculate Root Mean Squared Error."""
+    return _rmse(MetricInputs(y_true, y_pred))
+
+
+def calculate_mape(y_true: np.array, y_pred: np.array) -> float:
+    """Calculate Mean Absolute Percentage Error."""
+    return _mape(MetricInputs(y_true, y_pred))
+
+
+def calculate_smape(y_true: np.array, y_pred: np.array) -> float:
+    """
+    Calculate Symmetric Mean Absolute Percentage Error (SMAPE).
+    """
+    return _smape(MetricInputs(y_true, y_pred))
+
+
+def calculate_mase(y_true: np.array, y_pred: np.array) -> float:
+    """Calculate Mean Absolute Scaled Error."""
+    return _mase(MetricInputs(y_true, y_pred))
+
+
+def calculate_r2(y_true: np.array, y_pred: np.array) -> float:
+    """Calculate R-squared (coefficient of determination)."""
+    return _r2(MetricInputs(y_true, y_pred))
+
+
+def evaluate_preds(
+    y_true: np.array, y_pred: np.array, metrics: Optional[List[str]] = None
+) -> dict:
+    """
+    Evaluate regression predictions using various metrics, with NumPy only.
+
+    Gives the same results as the TensorFlow implementation in
+    `timepulse.metrics.regression_metrics`, without the eager op dispatch that dominates
+    its run time on small arrays. The intermediates shared by the selected metrics are
+    computed once.
+
+    Parameters
+    ----------
+    y_true : np.array
+        The true values.
+
+    y_pred : np.array
+        The predicted values.
+
+    metrics : list of str, optional
+        Names of the metrics to compute, built-in or added with `register_metric`.
+        Defaults to the built-in metrics, `METRIC_NAMES`.
+
+    Returns
+    -------
+    dict
+        Dictionary containing evaluation metrics:
+        - "mae": Mean Absolute Error,
+        - "mse": Mean Squared Error,
+        - "rmse": Root Mean Squared Error,
+        - "mape": Mean Absolute Percentage Error,
+        - "smape": Symmetric Mean Absolute Percentage Error,
+        - "mase": Mean Absolute Scaled Error,
+        - "r2_score": R-squared.
+    """
+    metrics = METRIC_NAMES if metrics is None else metrics
+    unknown = [name for name in metrics if name not in METRICS]
+    if unknown:
+        raise ValueError(f"Unknown metrics {unknown}, registered: {list(METRICS)}")
+
+    # Make sure float32 (for metric calculations)
+    inputs = MetricInputs(
+        np.asarray(y_true, dtype=np.float32), np.asarray(y_pred, dtype=np.float32)
+    )
+    return {name: METRICS[name](inputs) for name in metrics}
+
+
+def _segment_sum(x: np.array, starts: np.array, ends: np.array) -> np.array:
+    """Sums x[start:end] for every pair of bounds, with one cumulative sum."""
+    cumsum = np.concatenate([[0.0], np.cumsum(x, dtype=np.float64)])
+    return cumsum[ends] - cumsum[starts]
+
+
+def evaluate_batch(
+    y_true: np.array, y_pred: np.array, offsets: Optional[np.array] = None
+) -> np.array:
+    """
+    Evaluate many forecasts at once, e.g. every series, model and fold of a leaderboard.
+
+    Every forecast gets the metrics of `evaluate_preds` on its own values, MASE being scaled
+    by the naive error of its own series.
+
+    Parameters
+    ----------
+    y_true : np.array
+        Stacked true values of shape (..., n_timesteps), e.g. (n_series, n_models, n_folds,
+        n_timesteps). With `offsets`, the 1D concatenation of all series.
+
+    y_pred : np.array
+        Predicted values, of the same shape as `y_true`.
+
+    offsets : np.array, optional
+        For series of different lengths, the n_series + 1 boundaries of the series in the
+        concatenated arrays: series i is y_true[offsets[i]:offsets[i + 1]].
+
+    Returns
+    -------
+    np.array
+        Structured array of shape y_true.shape[:-1], or (n_series,) with `offsets`, with one
+        float64 field per metric of `METRIC_NAMES`. `result["mase"]` is the MASE array and
+        `pd.DataFrame(result.reshape(-1))` the metrics table.
+
+    Example
+    -------
+    y_true, y_pred: arrays of shape (2000, 5, 30, 7)
+    results = evaluate_batch(y_true, y_pred)
+    mean_mase_per_model = results["mase"].mean(axis=(0, 2))
+    """
+    y_true = np.asarray(y_true, dtype=np.float32)
+    y_pred = np.asarray(y_pred, dtype=np.float32)
+    errors = y_pred - y_true
+    abs_errors = np.abs(errors)
+    squared_errors = np.square(errors)
+    percentage_errors = abs_errors / np.maximum(np.abs(y_true), EPSILON)
+    denominator = (np.abs(y_pred) + np.abs(y_true)) / 2
+    mask = denominator != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        symmetric_errors = np.where(mask, 200 * abs_errors / denominator, 0)
+
+    if offsets is None:
+        n = y_true.shape[-1]
+        sums = lambda x: np.sum(x, axis=-1, dtype=np.float64)
+        n_naive = n - 1
+        naive_sums = sums(np.abs(np.diff(y_true, axis=-1)))
+        centered = y_true - np.mean(y_true, axis=-1, keepdims=True)
+    else:
+        offsets = np.asarray(offsets)
+        starts, ends = offsets[:-1], offsets[1:]
+        n = ends - starts
+        sums = lambda x: _segment_sum(x, starts, ends)
+        # Naive differences crossing two series are summed but fall outside every segment
+        n_naive = np.maximum(n - 1, 0)
+        naive_sums = _segment_sum(
+            np.abs(np.diff(y_true)), starts, np.maximum(ends - 1, starts)
+        )
+        centered = y_true - np.repeat(sums(y_true) / n, n)
+
+    result = np.empty(np.shape(n_naive + naive_sums), dtype=METRICS_DTYPE)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["mae"] = sums(abs_errors) / n
+        result["mse"] = sums(squared_errors) / n
+        result["rmse"] = np.sqrt(result["mse"])
+        result["mape"] = 100 * sums(percentage_errors) / n
+        n_masked = sums(mask)
+        result["smape"] = np.where(n_masked > 0, sums(symmetric_errors) / n_masked, 0)
+        result["smape"] = np.nan_to_num(result["smape"], nan=0.0)
+        naive = naive_sums / n_naive
+        result["mase"] = np.where(naive == 0, 0.0, result["mae"] / (naive + EPSILON))
+        sst = sums(np.square(centered))
+        result["r2_score"] = 1 - sums(squared_errors) / (sst + EPSILON)
+    return result
+
+
+def evaluate_horizon(
+    y_true: np.array, y_pred: np.array, metrics: Optional[List[str]] = None
+) -> Tuple[Dict[str, np.array], Dict[str, np.array]]:
+    """
+    Evaluate multi-step forecasts step by step, to see how the error grows with the horizon.
+
+    Step h is evaluated on the h-th label of every sample, in one vectorized pass with
+    `evaluate_batch`. MASE of a step is scaled by the naive error of its labels over
+    consecutive samples, i.e. the one-step naive error of the series.
+
+    Parameters
+    ----------
+    y_true : np.array
+        True labels of shape (n_samples, horizon), e.g. from `make_windows`, or
+        (..., n_samples, horizon) for several series or models at once.
+
+    y_pred : np.array
+        Predicted labels, of the same shape as `y_true`.
+
+    metrics : list of str, optional
+        Names of the metrics to return, among `METRIC_NAMES`. Defaults to all of them.
+
+    Returns
+    -------
+    Tuple[Dict[str, np.array], Dict[str, np.array]]
+        Each metric by step, with shape (horizon,) or (..., horizon), and its aggregate,
+        the mean over the steps.
+
+    Example
+    -------
+    by_step, aggregate = evaluate_horizon(test_labels, model_instance.predict(test_windows))
+    by_step["mae"]  # array of length horizon
+    """
+    metrics = METRIC_NAMES if metrics is None else metrics
+    unknown = [name for name in metrics if name not in METRIC_NAMES]
+    if unknown:
+        raise ValueError(f"Unknown metrics {unknown}, available: {METRIC_NAMES}")
+
+    results = evaluate_batch(np.swapaxes(y_true, -1, -2), np.swapaxes(y_pred, -1, -2))
+    by_step = {name: results[name] for name in metrics}
+    aggregate = {name: np.mean(values, axis=-1) for name, values in by_step.items()}
+    return by_step, aggregate
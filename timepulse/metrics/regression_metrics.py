@@ -1,5 +1,7 @@
 import tensorflow as tf
 import numpy as np
+from typing import List, Optional
+from timepulse.metrics import numpy_metrics
 
 
 def calculate_mae(y_true: np.array, y_pred: np.array) -> float:
@@ -55,7 +57,12 @@ def calculate_r2(y_true: np.array, y_pred: np.array) -> float:
     return r2.numpy()
 
 
-def evaluate_preds(y_true: np.array, y_pred: np.array) -> dict:
+def evaluate_preds(
+    y_true: np.array,
+    y_pred: np.array,
+    backend: str = "numpy",
+    metrics: Optional[List[str]] = None,
+) -> dict:
     """
     Evaluate regression predictions using various metrics.
 
@@ -67,6 +74,16 @@ def evaluate_preds(y_true: np.array, y_pred: np.array) -> dict:
     y_pred : np.array
         The predicted values.
 
+    backend : str, optional, default: "numpy"
+        "numpy" computes the metrics with `timepulse.metrics.numpy_metrics`, "tensorflow" with
+        the TensorFlow functions of this module. Both give the same results, NumPy is much
+        faster on the small arrays of backtests.
+
+    metrics : list of str, optional
+        Names of the metrics to compute, default all of them. With the NumPy backend, only
+        the selected metrics are computed and metrics added with
+        `timepulse.metrics.numpy_metrics.register_metric` can be selected too.
+
     Returns
     -------
     dict
@@ -79,6 +96,13 @@ def evaluate_preds(y_true: np.array, y_pred: np.array) -> dict:
         - "mase": Mean Absolute Scaled Error,
         - "r2_score": R-squared.
     """
+    if backend == "numpy":
+        return numpy_metrics.evaluate_preds(y_true, y_pred, metrics=metrics)
+    if backend != "tensorflow":
+        raise ValueError(
+            f"Unknown backend {backend!r}, expected 'numpy' or 'tensorflow'"
+        )
+
     # Make sure float32 (for metric calculations)
     y_true = tf.cast(y_true, dtype=tf.float32)
     y_pred = tf.cast(y_pred, dtype=tf.float32)
@@ -92,7 +116,7 @@ def evaluate_preds(y_true: np.array, y_pred: np.array) -> dict:
     mase = calculate_mase(y_true, y_pred)
     r2 = calculate_r2(y_true, y_pred)
 
-    return {
+    results = {
         "mae": mae,
         "mse": mse,
         "rmse": rmse,
@@ -101,3 +125,9 @@ def evaluate_preds(y_true: np.array, y_pred: np.array) -> dict:
         "mase": mase,
         "r2_score": r2,
     }
+    if metrics is None:
+        return results
+    unknown = [name for name in metrics if name not in results]
+    if unknown:
+        raise ValueError(f"Unknown metrics {unknown} for the tensorflow backend")
+    return {name: results[name] for name in metrics}
@@ -0,0 +1,245 @@
+import numpy as np
+from typing import Dict, Optional, Tuple
+from timepulse.metrics.numpy_metrics import EPSILON, METRIC_NAMES
+
+
+def _as_flat(y_true: np.array, y_pred: np.array) -> Tuple[np.array, np.array]:
+    y_true = np.asarray(y_true, dtype=np.float64).reshape(-1)
+    y_pred = np.asarray(y_pred, dtype=np.float64).reshape(-1)
+    return y_true, y_pred
+
+
+class MetricAccumulator:
+    """
+    Base class of the streaming metrics: the mean of a per-value term, kept as a running
+    total and count.
+
+    Chunks are flattened and treated as consecutive parts of one series. `merge` adds the
+    statistics of an accumulator updated with the chunks that follow, e.g. on another worker,
+    so out-of-core and parallel evaluation give the results of `evaluate_preds` on the full
+    arrays.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.count = 0
+
+    def _terms(self, y_true: np.array, y_pred: np.array) -> Tuple[float, int]:
+        raise NotImplementedError
+
+    def update(self, y_true: np.array, y_pred: np.array) -> "MetricAccumulator":
+        """
+        Adds a chunk of true and predicted values. Returns the accumulator.
+        """
+        total, count = self._terms(*_as_flat(y_true, y_pred))
+        self.total += total
+        self.count += count
+        return self
+
+    def merge(self, other: "MetricAccumulator") -> "MetricAccumulator":
+        """
+        Adds the statistics of `other`, which holds the chunks following those of this
+        accumulator. Returns the accumulator.
+        """
+        self.total += other.total
+        self.count += other.count
+        return self
+
+    def result(self) -> float:
+        return self.total / self.count if self.count else np.nan
+
+
+class MAEAccumulator(MetricAccumulator):
+    """Streaming Mean Absolute Error."""
+
+    def _terms(self, y_true, y_pred):
+        return np.sum(np.abs(y_pred - y_true)), y_true.size
+
+
+class MSEAccumulator(MetricAccumulator):
+    """Streaming Mean Squared Error."""
+
+    def _terms(self, y_true, y_pred):
+        return np.sum(np.square(y_pred - y_true)), y_true.size
+
+
+class RMSEAccumulator(MSEAccumulator):
+    """Streaming Root Mean Squared Error."""
+
+    def result(self) -> float:
+        return np.sqrt(super().result())
+
+
+class MAPEAccumulator(MetricAccumulator):
+    """Streaming Mean Absolute Percentage Error."""
+
+    def _terms(self, y_true, y_pred):
+        diff = np.abs((y_true - y_pred) / np.maximum(np.abs(y_true), EPSILON))
+        return 100.0 * np.sum(diff), y_true.size
+
+
+class SMAPEAccumulator(MetricAccumulator):
+    """Streaming Symmetric Mean Absolute Percentage Error, over non-zero denominators."""
+
+    def _terms(self, y_true, y_pred):
+        numerator = np.abs(y_pred - y_true)
+        denominator = (np.abs(y_pred) + np.abs(y_true)) / 2
+        mask = denominator != 0
+        return np.sum(200 * numerator[mask] / denominator[mask]), np.sum(mask)
+
+    def result(self) -> float:
+        smape = super().result()
+        return 0.0 if np.isnan(smape) else smape
+
+
+class MASEAccumulator:
+    """
+    Streaming Mean Absolute Scaled Error.
+
+    Keeps the first and last true values seen, so the naive difference across the boundary
+    of two chunks is counted when they are merged.
+    """
+
+    def __init__(self) -> None:
+        self.mae = MAEAccumulator()
+        self.naive_total = 0.0
+        self.naive_count = 0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+
+    def _add_boundary(self, first: float) -> None:
+        if self.last is not None:
+            self.naive_total += abs(first - self.last)
+            self.naive_count += 1
+
+    def update(self, y_true: np.array, y_pred: np.array) -> "MASEAccumulator":
+        y_true, y_pred = _as_flat(y_true, y_pred)
+        if y_true.size == 0:
+            return self
+        self.mae.update(y_true, y_pred)
+        self._add_boundary(y_true[0])
+        self.naive_total += np.sum(np.abs(np.diff(y_true)))
+        self.naive_count += y_true.size - 1
+        if self.first is None:
+            self.first = y_true[0]
+        self.last = y_true[-1]
+        return self
+
+    def merge(self, other: "MASEAccumulator") -> "MASEAccumulator":
+        if other.first is None:
+            return self
+        self.mae.merge(other.mae)
+        self._add_boundary(other.first)
+        self.naive_total += other.naive_total
+        self.naive_count += other.naive_count
+        if self.first is None:
+            self.first = other.first
+        self.last = other.last
+        return self
+
+    def result(self) -> float:
+        naive = self.naive_total / self.naive_count if self.naive_count else np.nan
+        if naive == 0:
+            return 0.0
+        return self.mae.result() / (naive + EPSILON)
+
+
+class R2Accumulator:
+    """
+    Streaming R-squared.
+
+    Keeps the count, mean and sum of squared deviations of the true values, merged with
+    Chan's parallel update, and the sum of squared errors.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sse = 0.0
+
+    def _combine(self, count: int, mean: float, m2: float, sse: float) -> None:
+        total_count = self.count + count
+        if total_count == 0:
+            return
+        delta = mean - self.mean
+        self.m2 += m2 + delta**2 * self.count * count / total_count
+        self.mean += delta * count / total_count
+        self.count = total_count
+        self.sse += sse
+
+    def update(self, y_true: np.array, y_pred: np.array) -> "R2Accumulator":
+        y_true, y_pred = _as_flat(y_true, y_pred)
+        if y_true.size == 0:
+            return self
+        mean = np.mean(y_true)
+        self._combine(
+            y_true.size,
+            mean,
+            np.sum(np.square(y_true - mean)),
+            np.sum(np.square(y_true - y_pred)),
+        )
+        return self
+
+    def merge(self, other: "R2Accumulator") -> "R2Accumulator":
+        self._combine(other.count, other.mean, other.m2, other.sse)
+        return self
+
+    def result(self) -> float:
+        return 1 - self.sse / (self.m2 + EPSILON)
+
+
+ACCUMULATORS = {
+    "mae": MAEAccumulator,
+    "mse": MSEAccumulator,
+    "rmse": RMSEAccumulator,
+    "mape": MAPEAccumulator,
+    "smape": SMAPEAccumulator,
+    "mase": MASEAccumulator,
+    "r2_score": R2Accumulator,
+}
+
+
+class MetricsAccumulator:
+    """
+    Streaming version of `evaluate_preds`, holding one accumulator per metric.
+
+    Parameters
+    ----------
+    metrics : list of str, optional
+        Names of the metrics to accumulate, default all of `METRIC_NAMES`.
+
+    Examples
+    --------
+    >>> accumulator = MetricsAccumulator()
+    >>> for y_true, y_pred in chunks:
+    ...     accumulator.update(y_true, y_pred)
+    >>> accumulator.result()
+
+    Across workers, each returning the accumulator of consecutive chunks:
+
+    >>> accumulators = pool.map(evaluate_chunks, chunk_ranges)
+    >>> functools.reduce(MetricsAccumulator.merge, accumulators).result()
+    """
+
+    def __init__(self, metrics: Optional[list] = None) -> None:
+        self.accumulators = {
+            name: ACCUMULATORS[name]() for name in (metrics or METRIC_NAMES)
+        }
+
+    def update(self, y_true: np.array, y_pred: np.array) -> "MetricsAccumulator":
+        y_true, y_pred = _as_flat(y_true, y_pred)
+        for accumulator in self.accumulators.values():
+            accumulator.update(y_true, y_pred)
+        return self
+
+    def merge(self, other: "MetricsAccumulator") -> "MetricsAccumulator":
+        for name, accumulator in self.accumulators.items():
+            accumulator.merge(other.accumulators[name])
+        return self
+
+    def result(self) -> Dict[str, float]:
+        return {
+            name: accumulator.result()
+            for name, accumulator in self.accumulators.items()
+        }
@@ -1,8 +1,14 @@
-from timepulse.utils.models import create_early_stopping
+from timepulse.utils.models import (
+    create_early_stopping,
+    fit_arrays,
+    fit_dataset,
+    fold_scalers,
+)
 from timepulse.processing.min_max_scaler import MinMaxScalerWrapper
+from timepulse.utils.dtypes import as_float_array
 import tensorflow as tf
 import numpy as np
-from typing import List, Optional, Tuple, Type
+from typing import List, Optional, Tuple, Type, Union
 
 
 class LSTM:
@@ -16,6 +22,8 @@ class LSTM:
         batch_size: Optional[int] = None,
         scaler_class: Type = MinMaxScalerWrapper(),
         callbacks: List = [create_early_stopping()],
+        in_graph_scaling: bool = False,
+        use_tf_data: bool = False,
     ) -> None:
         self.horizon = horizon
         self.input_shape = input_shape
@@ -28,6 +36,9 @@ class LSTM:
         self.model = None
         self.model_name = "lstm_model"
         self.callbacks = callbacks
+        self.in_graph_scaling = in_graph_scaling
+        self.use_tf_data = use_tf_data
+        self.serving_model = None
 
     def build(self) -> None:
         self.model = tf.keras.Sequential(
@@ -46,40 +57,58 @@ class LSTM:
             optimizer=tf.keras.optimizers.legacy.Adam(learning_rate=learning_rate),
         )
 
+    def _to_sequences(self, X: np.array, fit: bool = False) -> np.array:
+        """
+        Scales X per feature and shapes it as (samples, timesteps, features).
+
+        3D inputs, e.g. from `make_multivariate_windows`, keep their timesteps. 2D inputs of
+        lag columns are treated as a single timestep.
+        """
+        X = np.asarray(X)
+        n_features = X.shape[-1]
+        X_flat = np.reshape(X, (-1, n_features))
+        if self.scaler_X is not None:
+            if fit:
+                X_flat = self.scaler_X.fit_transform_X(X_flat)
+            else:
+                X_flat = self.scaler_X.transform_X(X_flat)
+        if X.ndim == 3:
+            return np.reshape(X_flat, X.shape)
+        return np.reshape(X_flat, (X_flat.shape[0], 1, n_features))
+
     def fit(
         self,
-        X_train: np.array,
-        y_train: np.array,
-        X_val: np.array,
-        y_val: np.array,
+        X_train: Union[np.array, tf.data.Dataset],
+        y_train: Optional[np.array] = None,
+        X_val: Optional[Union[np.array, tf.data.Dataset]] = None,
+        y_val: Optional[np.array] = None,
         verbose: int = 0,
     ) -> None:
+        self.serving_model = None
+        if isinstance(X_train, tf.data.Dataset):
+            return fit_dataset(self, X_train, X_val, verbose=verbose)
+        X_train, y_train, X_val, y_val = (
+            as_float_array(data) for data in (X_train, y_train, X_val, y_val)
+        )
         if self.scaler_X is not None:
-            X_train = self.scaler_X.fit_transform_X(X_train)
             y_train = self.scaler_y.fit_transform_y(
                 y_train.reshape(len(y_train), 1)
             ).flatten()
-            X_val = self.scaler_X.transform_X(X_val)
             y_val = self.scaler_y.transform_y(y_val.reshape(len(y_val), 1)).flatten()
-        X_train_reshaped = np.reshape(X_train, (X_train.shape[0], 1, X_train.shape[1]))
-        X_val_reshaped = np.reshape(X_val, (X_val.shape[0], 1, X_val.shape[1]))
-        self.model.fit(
-            X_train_reshaped,
-            y_train,
-            epochs=self.epochs,
-            verbose=verbose,
-            batch_size=self.batch_size,
-            validation_data=(X_val_reshaped, y_val),
-            callbacks=self.callbacks,
+        X_train_reshaped = self._to_sequences(X_train, fit=True)
+        X_val_reshaped = self._to_sequences(X_val)
+        fit_arrays(
+            self, X_train_reshaped, y_train, X_val_reshaped, y_val, verbose=verbose
         )
+        if self.in_graph_scaling and self.scaler_X is not None:
+            self.serving_model = fold_scalers(self, input_shape=np.shape(X_train)[1:])
 
     def predict(self, X_test: np.array) -> np.array:
+        X_test = as_float_array(X_test)
+        if self.serving_model is not None:
+            return self.serving_model.predict(X_test).flatten()
+        X_test_reshaped = self._to_sequences(X_test)
+        y_pred = self.model.predict(X_test_reshaped)
         if self.scaler_X is not None:
-            X_test = self.scaler_X.transform_X(X_test)
-            X_test_reshaped = np.reshape(X_test, (X_test.shape[0], 1, X_test.shape[1]))
-            y_pred = self.model.predict(X_test_reshaped)
             y_pred = self.scaler_y.inverse_transform_y(y_pred.reshape(-1, 1))
-        else:
-            X_test_reshaped = np.reshape(X_test, (X_test.shape[0], 1, X_test.shape[1]))
-            y_pred = self.model.predict(X_test_reshaped)
         return y_pred.flatten()
@@ -1,8 +1,14 @@
 import tensorflow as tf
 import numpy as np
-from timepulse.utils.models import create_early_stopping
-from typing import Tuple, List, Dict, Type
+from timepulse.utils.models import (
+    create_early_stopping,
+    fit_arrays,
+    fit_dataset,
+    fold_scalers,
+)
+from typing import Tuple, List, Dict, Optional, Type, Union
 from timepulse.processing.min_max_scaler import MinMaxScalerWrapper
+from timepulse.utils.dtypes import as_float_array
 
 
 class NBeatsBlock(tf.keras.layers.Layer):
@@ -116,6 +122,14 @@ class NBeats(tf.keras.Model):
     callbacks : List[tf.keras.callbacks.Callback], optional, default: [ReduceLROnPlateau, EarlyStopping]
         List of callbacks to monitor and control the training process.
 
+    in_graph_scaling : bool, optional, default: False
+        Whether `fit` folds the fitted scalers into `serving_model`, which `predict` then calls
+        on raw inputs, see `timepulse.utils.models.fold_scalers`.
+
+    use_tf_data : bool, optional, default: False
+        Whether `fit` feeds the arrays through cached, shuffled, batched and prefetched
+        tf.data pipelines, see `timepulse.utils.models.fit_arrays`.
+
     **kwargs
         Additional keyword arguments for the parent class.
 
@@ -124,6 +138,9 @@ class NBeats(tf.keras.Model):
     model : tf.keras.Model
         The NBeats model.
 
+    serving_model : tf.keras.Model
+        The model with in-graph scaling, taking raw inputs, when `in_graph_scaling` is set.
+
     Methods
     -------
     build()
@@ -134,6 +151,7 @@ class NBeats(tf.keras.Model):
 
     fit(X_train, y_train, X_val, y_val, verbose=0)
         Train the NBeats model with EarlyStopping and ReduceLROnPlateau callbacks.
+        X_train and X_val can also be batched tf.data datasets of (X, y) pairs.
 
     predict(X_test)
         Generate predictions using the trained NBeats model.
@@ -166,6 +184,8 @@ class NBeats(tf.keras.Model):
                 monitor="val_loss", patience=200, restore_best_weights=True
             ),
         ],
+        in_graph_scaling: bool = False,
+        use_tf_data: bool = False,
         **kwargs: Dict,
     ) -> None:
         super().__init__(**kwargs)
@@ -183,6 +203,9 @@ class NBeats(tf.keras.Model):
         self.scaler_X = scaler_class
         self.scaler_y = scaler_class
         self.callbacks = callbacks
+        self.in_graph_scaling = in_graph_scaling
+        self.use_tf_data = use_tf_data
+        self.serving_model = None
         self.initial_block = NBeatsBlock(
             input_size=window_size * horizon,
             theta_size=window_size * horizon + horizon,
@@ -229,12 +252,18 @@ class NBeats(tf.keras.Model):
 
     def fit(
         self,
-        X_train: np.array,
-        y_train: np.array,
-        X_val: np.array,
-        y_val: np.array,
+        X_train: Union[np.array, tf.data.Dataset],
+        y_train: Optional[np.array] = None,
+        X_val: Optional[Union[np.array, tf.data.Dataset]] = None,
+        y_val: Optional[np.array] = None,
         verbose: int = 0,
     ) -> None:
+        self.serving_model = None
+        if isinstance(X_train, tf.data.Dataset):
+            return fit_dataset(self, X_train, X_val, verbose=verbose)
+        X_train, y_train, X_val, y_val = (
+            as_float_array(data) for data in (X_train, y_train, X_val, y_val)
+        )
         if self.scaler_X is not None:
             X_train = self.scaler_X.fit_transform_X(X_train)
             y_train = self.scaler_y.fit_transform_y(
@@ -242,17 +271,14 @@ class NBeats(tf.keras.Model):
             ).flatten()
             X_val = self.scaler_X.transform_X(X_val)
             y_val = self.scaler_y.transform_y(y_val.reshape(len(y_val), 1)).flatten()
-        self.model.fit(
-            X_train,
-            y_train,
-            epochs=self.epochs,
-            validation_data=(X_val, y_val),
-            verbose=verbose,
-            batch_size=self.batch_size,
-            callbacks=self.callbacks,
-        )
+        fit_arrays(self, X_train, y_train, X_val, y_val, verbose=verbose)
+        if self.in_graph_scaling and self.scaler_X is not None:
+            self.serving_model = fold_scalers(self, input_shape=np.shape(X_train)[1:])
 
     def predict(self, X_test: np.array) -> None:
+        X_test = as_float_array(X_test)
+        if self.serving_model is not None:
+            return self.serving_model.predict(X_test).flatten()
         if self.scaler_X is not None:
             X_test = self.scaler_X.transform_X(X_test)
             y_pred = self.model.predict(X_test)
@@ -1,7 +1,13 @@
 import tensorflow as tf
-from timepulse.utils.models import create_early_stopping
+from timepulse.utils.models import (
+    create_early_stopping,
+    fit_arrays,
+    fit_dataset,
+    fold_scalers,
+)
 from timepulse.processing.min_max_scaler import MinMaxScalerWrapper
-from typing import List, Type
+from timepulse.utils.dtypes import as_float_array
+from typing import List, Optional, Type, Union
 import numpy as np
 
 
@@ -16,6 +22,8 @@ class MultivariateDense:
         batch_size: int = 128,
         scaler_class: Type = MinMaxScalerWrapper(),
         callbacks: List = [create_early_stopping()],
+        in_graph_scaling: bool = False,
+        use_tf_data: bool = False,
     ) -> None:
         self.horizon = horizon
         self.n_neurons0 = n_neurons0
@@ -28,6 +36,9 @@ class MultivariateDense:
         self.model_name = f"dense_model"
         self.model = None
         self.callbacks = callbacks
+        self.in_graph_scaling = in_graph_scaling
+        self.use_tf_data = use_tf_data
+        self.serving_model = None
 
     def build(self) -> None:
         layers = [tf.keras.layers.Dense(self.n_neurons0, activation="relu")]
@@ -44,12 +55,18 @@ class MultivariateDense:
 
     def fit(
         self,
-        X_train: np.array,
-        y_train: np.array,
-        X_val: np.array,
-        y_val: np.array,
+        X_train: Union[np.array, tf.data.Dataset],
+        y_train: Optional[np.array] = None,
+        X_val: Optional[Union[np.array, tf.data.Dataset]] = None,
+        y_val: Optional[np.array] = None,
         verbose: int = 0,
     ) -> None:
+        self.serving_model = None
+        if isinstance(X_train, tf.data.Dataset):
+            return fit_dataset(self, X_train, X_val, verbose=verbose)
+        X_train, y_train, X_val, y_val = (
+            as_float_array(data) for data in (X_train, y_train, X_val, y_val)
+        )
         if self.scaler_X is not None:
             X_train = self.scaler_X.fit_transform_X(X_train)
             y_train = self.scaler_y.fit_transform_y(
@@ -57,17 +74,14 @@ class MultivariateDense:
             ).flatten()
             X_val = self.scaler_X.transform_X(X_val)
             y_val = self.scaler_y.transform_y(y_val.reshape(len(y_val), 1)).flatten()
-        self.model.fit(
-            X_train,
-            y_train,
-            epochs=self.epochs,
-            batch_size=self.batch_size,
-            verbose=verbose,
-            validation_data=(X_val, y_val),
-            callbacks=self.callbacks,
-        )
+        fit_arrays(self, X_train, y_train, X_val, y_val, verbose=verbose)
+        if self.in_graph_scaling and self.scaler_X is not None:
+            self.serving_model = fold_scalers(self, input_shape=np.shape(X_train)[1:])
 
     def predict(self, X_test: np.array) -> np.array:
+        X_test = as_float_array(X_test)
+        if self.serving_model is not None:
+            return self.serving_model.predict(X_test).flatten()
         if self.scaler_X is not None:
             X_test = self.scaler_X.transform_X(X_test)
             y_pred = self.model.predict(X_test)
@@ -1,6 +1,7 @@
 from xgboost import XGBRegressor
 from timepulse.processing.min_max_scaler import MinMaxScalerWrapper
 import numpy as np
+from timepulse.utils.dtypes import as_float_array
 import joblib
 import os
 from typing import Type, Dict
@@ -30,6 +31,9 @@ class XGBoostRegressor:
         y_val: np.array,
         verbose: int = 0,
     ) -> None:
+        X_train, y_train, X_val, y_val = (
+            as_float_array(data) for data in (X_train, y_train, X_val, y_val)
+        )
         if self.scaler_X is not None:
             X_train = self.scaler_X.fit_transform_X(X_train)
             y_train = self.scaler_y.fit_transform_y(
@@ -45,6 +49,7 @@ class XGBoostRegressor:
         )
 
     def predict(self, X_test: np.array) -> None:
+        X_test = as_float_array(X_test)
         if self.scaler_X is not None:
             X_test = self.scaler_X.transform_X(X_test)
             y_pred = self.model.predict(X_test)
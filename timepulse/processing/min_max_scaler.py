@@ -1,26 +1,61 @@
 from sklearn.preprocessing import MinMaxScaler
+import copy
 import numpy as np
+from typing import Optional
+from timepulse.utils.dtypes import as_float_array
+
+
+def _merge_min_max(scaler: MinMaxScaler, other: MinMaxScaler) -> MinMaxScaler:
+    """Merges the running min/max of two partially fitted scalers into `scaler`."""
+    if not hasattr(other, "n_samples_seen_"):
+        return scaler
+    if not hasattr(scaler, "n_samples_seen_"):
+        return copy.deepcopy(other)
+    # The extremes of `other` as two samples update min, max and the scaling parameters
+    scaler.partial_fit(np.vstack([other.data_min_, other.data_max_]))
+    scaler.n_samples_seen_ += other.n_samples_seen_ - 2
+    return scaler
 
 
 class MinMaxScalerWrapper:
-    def __init__(self) -> None:
+    def __init__(self, dtype: Optional[np.dtype] = None) -> None:
+        # Converts the data to dtype, or to the global float dtype of
+        # timepulse.utils.dtypes, sklearn then keeps float32 data float32
+        self.dtype = dtype
         self.scaler_X = MinMaxScaler()
         self.scaler_y = MinMaxScaler()
 
     def fit_transform_X(self, data: np.array) -> np.array:
-        return self.scaler_X.fit_transform(data)
+        return self.scaler_X.fit_transform(as_float_array(data, self.dtype))
+
+    def partial_fit_X(self, data: np.array) -> "MinMaxScalerWrapper":
+        self.scaler_X.partial_fit(as_float_array(data, self.dtype))
+        return self
 
     def transform_X(self, data: np.array) -> np.array:
-        return self.scaler_X.transform(data)
+        return self.scaler_X.transform(as_float_array(data, self.dtype))
 
     def inverse_transform_X(self, data: np.array) -> np.array:
-        return self.scaler_X.inverse_transform(data)
+        return self.scaler_X.inverse_transform(as_float_array(data, self.dtype))
 
     def fit_transform_y(self, data: np.array) -> np.array:
-        return self.scaler_y.fit_transform(data)
+        return self.scaler_y.fit_transform(as_float_array(data, self.dtype))
+
+    def partial_fit_y(self, data: np.array) -> "MinMaxScalerWrapper":
+        self.scaler_y.partial_fit(as_float_array(data, self.dtype))
+        return self
 
     def transform_y(self, data: np.array) -> np.array:
-        return self.scaler_y.transform(data)
+        return self.scaler_y.transform(as_float_array(data, self.dtype))
 
     def inverse_transform_y(self, data: np.array) -> np.array:
-        return self.scaler_y.inverse_transform(data)
+        return self.scaler_y.inverse_transform(as_float_array(data, self.dtype))
+
+    def merge(self, other: "MinMaxScalerWrapper") -> "MinMaxScalerWrapper":
+        """
+        Merges the running min/max of a wrapper partially fitted on other chunks,
+        e.g. on another worker.
+        """
+        self.scaler_X = _merge_min_max(self.scaler_X, other.scaler_X)
+        self.scaler_y = _merge_min_max(self.scaler_y, other.scaler_y)
+        return self
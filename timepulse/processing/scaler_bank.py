@@ -0,0 +1,167 @@
+import numpy as np
+from typing import Optional, Tuple
+from timepulse.utils.dtypes import resolve_float_dtype
+
+
+def _as_2d(data: np.array, dtype: Optional[np.dtype]) -> np.array:
+    dtype = resolve_float_dtype(dtype)
+    data = np.asarray(data, dtype=np.float64 if dtype is None else dtype)
+    return data.reshape(-1, 1) if data.ndim == 1 else data
+
+
+class SeriesScaler:
+    """
+    Scales each series of a long-format panel with its own parameters.
+
+    The parameters of all series are stored in (n_series, n_features) arrays whose rows
+    follow `series_ids_`, and every transform is one vectorized operation over the panel.
+    Parameters fitted on a single column broadcast over all columns, so windows of a
+    univariate series can be scaled with the parameters of its values.
+
+    Data is converted to `dtype`, or to the global float dtype of `timepulse.utils.dtypes`,
+    float64 by default.
+    """
+
+    def __init__(self, dtype: Optional[np.dtype] = None) -> None:
+        self.dtype = dtype
+        self.series_ids_ = None
+        self.center_ = None
+        self.scale_ = None
+
+    def _group_stats(
+        self, data: np.array, order: np.array, starts: np.array, counts: np.array
+    ) -> Tuple[np.array, np.array]:
+        """
+        Returns the center and scale of every series, series i being the rows
+        data[order][starts[i] : starts[i] + counts[i]].
+        """
+        raise NotImplementedError
+
+    def _codes(self, series_ids: np.array) -> np.array:
+        series_ids = np.asarray(series_ids)
+        codes = np.searchsorted(self.series_ids_, series_ids)
+        codes = np.minimum(codes, len(self.series_ids_) - 1)
+        unknown = self.series_ids_[codes] != series_ids
+        if np.any(unknown):
+            raise ValueError(f"Unknown series {np.unique(series_ids[unknown])}")
+        return codes
+
+    def fit(self, data: np.array, series_ids: np.array) -> "SeriesScaler":
+        """
+        Fits the parameters of every series, `series_ids` giving the series of each row.
+        """
+        data = _as_2d(data, self.dtype)
+        self.series_ids_, codes, counts = np.unique(
+            series_ids, return_inverse=True, return_counts=True
+        )
+        order = np.argsort(codes, kind="stable")
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        self.center_, scale = self._group_stats(data, order, starts, counts)
+        # Constant series are left unscaled, as in sklearn
+        self.scale_ = np.where(scale == 0, 1.0, scale)
+        return self
+
+    def transform(self, data: np.array, series_ids: np.array) -> np.array:
+        codes = self._codes(series_ids)
+        scaled = (_as_2d(data, self.dtype) - self.center_[codes]) / self.scale_[codes]
+        return scaled.reshape(np.shape(data))
+
+    def inverse_transform(self, data: np.array, series_ids: np.array) -> np.array:
+        codes = self._codes(series_ids)
+        unscaled = _as_2d(data, self.dtype) * self.scale_[codes] + self.center_[codes]
+        return unscaled.reshape(np.shape(data))
+
+    def fit_transform(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.fit(data, series_ids).transform(data, series_ids)
+
+
+class SeriesMinMaxScaler(SeriesScaler):
+    """
+    Per-series scaling to [0, 1]. `data_min_` and `data_max_` hold the range of each series.
+    """
+
+    def _group_stats(self, data, order, starts, counts):
+        sorted_data = data[order]
+        self.data_min_ = np.minimum.reduceat(sorted_data, starts, axis=0)
+        self.data_max_ = np.maximum.reduceat(sorted_data, starts, axis=0)
+        return self.data_min_, self.data_max_ - self.data_min_
+
+
+class SeriesStandardScaler(SeriesScaler):
+    """
+    Per-series standardization. `mean_` and `var_` hold the moments of each series.
+    """
+
+    def _group_stats(self, data, order, starts, counts):
+        sorted_data = data[order]
+        sizes = counts[:, None].astype(data.dtype)
+        self.mean_ = np.add.reduceat(sorted_data, starts, axis=0) / sizes
+        deviations = sorted_data - np.repeat(self.mean_, counts, axis=0)
+        self.var_ = np.add.reduceat(np.square(deviations), starts, axis=0) / sizes
+        return self.mean_, np.sqrt(self.var_)
+
+
+class MinMaxScalerBank:
+    """
+    Per-series counterpart of `MinMaxScalerWrapper` for panels of many series.
+
+    Every method takes the series id of each row along with the data.
+
+    Example
+    -------
+    scaler = MinMaxScalerBank()
+    X = panel_df[["sales", "price"]].values
+    X_scaled = scaler.fit_transform_X(X, series_ids=panel_df["store"].values)
+    """
+
+    def __init__(self, dtype: Optional[np.dtype] = None) -> None:
+        self.scaler_X = SeriesMinMaxScaler(dtype)
+        self.scaler_y = SeriesMinMaxScaler(dtype)
+
+    def fit_transform_X(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_X.fit_transform(data, series_ids)
+
+    def transform_X(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_X.transform(data, series_ids)
+
+    def inverse_transform_X(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_X.inverse_transform(data, series_ids)
+
+    def fit_transform_y(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_y.fit_transform(data, series_ids)
+
+    def transform_y(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_y.transform(data, series_ids)
+
+    def inverse_transform_y(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_y.inverse_transform(data, series_ids)
+
+
+class StandardScalerBank:
+    """
+    Per-series counterpart of `StandardScalerWrapper` for panels of many series.
+
+    Every method takes the series id of each row along with the data.
+    """
+
+    def __init__(self, dtype: Optional[np.dtype] = None) -> None:
+        self.scaler_X = SeriesStandardScaler(dtype)
+        self.scaler_y = SeriesStandardScaler(dtype)
+
+    def fit_transform_X(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_X.fit_transform(data, series_ids)
+
+    def transform_X(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_X.transform(data, series_ids)
+
+    def inverse_transform_X(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_X.inverse_transform(data, series_ids)
+
+    def fit_transform_y(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_y.fit_transform(data, series_ids)
+
+    def transform_y(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_y.transform(data, series_ids)
+
+    def inverse_transform_y(self, data: np.array, series_ids: np.array) -> np.array:
+        return self.scaler_y.inverse_transform(data, series_ids)
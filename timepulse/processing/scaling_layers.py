@@ -0,0 +1,69 @@
+import tensorflow as tf
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+from typing import Tuple
+
+
+def scaler_parameters(scaler) -> Tuple[np.array, np.array]:
+    """
+    Returns the center and scale of a fitted sklearn scaler, such that its transform is
+    (data - center) / scale.
+
+    Parameters
+    ----------
+    scaler : MinMaxScaler or StandardScaler
+        A fitted scaler, e.g. `scaler_X` of a `MinMaxScalerWrapper`.
+
+    Returns
+    -------
+    Tuple[np.array, np.array]
+        Center and scale, one value per feature.
+    """
+    if isinstance(scaler, MinMaxScaler):
+        # transform is data * scale_ + min_
+        return -scaler.min_ / scaler.scale_, 1 / scaler.scale_
+    if isinstance(scaler, StandardScaler):
+        n_features = scaler.n_features_in_
+        center = scaler.mean_ if scaler.mean_ is not None else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.scale_ is not None else np.ones(n_features)
+        return center, scale
+    raise ValueError(
+        f"Cannot fold a {type(scaler).__name__} into the model, "
+        "only MinMaxScaler and StandardScaler are supported"
+    )
+
+
+def make_scaling_layer(
+    scaler, invert: bool = False, name: str = None
+) -> tf.keras.layers.Normalization:
+    """
+    Creates a Keras layer applying the transform of a fitted sklearn scaler, or its inverse.
+
+    Parameters
+    ----------
+    scaler : MinMaxScaler or StandardScaler
+        A fitted scaler.
+
+    invert : bool, optional, default: False
+        Whether the layer applies the inverse transform, e.g. to unscale predictions.
+
+    name : str, optional
+        Name of the layer.
+
+    Returns
+    -------
+    tf.keras.layers.Normalization
+        Layer scaling the last axis of its inputs. The parameters of a scaler fitted on a
+        single feature, as the target scalers are, apply to every output.
+    """
+    center, scale = scaler_parameters(scaler)
+    axis = None if len(center) == 1 else -1
+    if axis is None:
+        center, scale = center[0], scale[0]
+    return tf.keras.layers.Normalization(
+        axis=axis,
+        mean=center,
+        variance=np.square(scale),
+        invert=invert,
+        name=name,
+    )
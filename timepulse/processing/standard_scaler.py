@@ -1,26 +1,74 @@
 from sklearn.preprocessing import StandardScaler
+import copy
 import numpy as np
+from typing import Optional
+from timepulse.utils.dtypes import as_float_array
+
+
+def _merge_moments(scaler: StandardScaler, other: StandardScaler) -> StandardScaler:
+    """
+    Merges the running mean/variance of two partially fitted scalers into `scaler`,
+    with Chan's parallel update.
+    """
+    if not hasattr(other, "n_samples_seen_"):
+        return scaler
+    if not hasattr(scaler, "n_samples_seen_"):
+        return copy.deepcopy(other)
+    n_samples_seen = scaler.n_samples_seen_ + other.n_samples_seen_
+    delta = other.mean_ - scaler.mean_
+    sum_squares = (
+        scaler.var_ * scaler.n_samples_seen_
+        + other.var_ * other.n_samples_seen_
+        + delta**2 * scaler.n_samples_seen_ * other.n_samples_seen_ / n_samples_seen
+    )
+    scaler.mean_ = scaler.mean_ + delta * other.n_samples_seen_ / n_samples_seen
+    scaler.var_ = sum_squares / n_samples_seen
+    scaler.n_samples_seen_ = n_samples_seen
+    # Constant features are left unscaled, as in StandardScaler
+    scale = np.sqrt(scaler.var_)
+    scaler.scale_ = np.where(scale == 0, 1.0, scale)
+    return scaler
 
 
 class StandardScalerWrapper:
-    def __init__(self) -> None:
+    def __init__(self, dtype: Optional[np.dtype] = None) -> None:
+        # Converts the data to dtype, or to the global float dtype of
+        # timepulse.utils.dtypes, sklearn then keeps float32 data float32
+        self.dtype = dtype
         self.scaler_X = StandardScaler()
         self.scaler_y = StandardScaler()
 
     def fit_transform_X(self, data: np.array) -> np.array:
-        return self.scaler_X.fit_transform(data)
+        return self.scaler_X.fit_transform(as_float_array(data, self.dtype))
+
+    def partial_fit_X(self, data: np.array) -> "StandardScalerWrapper":
+        self.scaler_X.partial_fit(as_float_array(data, self.dtype))
+        return self
 
     def transform_X(self, data: np.array) -> np.array:
-        return self.scaler_X.transform(data)
+        return self.scaler_X.transform(as_float_array(data, self.dtype))
 
     def inverse_transform_X(self, data: np.array) -> np.array:
-        return self.scaler_X.inverse_transform(data)
+        return self.scaler_X.inverse_transform(as_float_array(data, self.dtype))
 
     def fit_transform_y(self, data: np.array) -> np.array:
-        return self.scaler_y.fit_transform(data)
+        return self.scaler_y.fit_transform(as_float_array(data, self.dtype))
+
+    def partial_fit_y(self, data: np.array) -> "StandardScalerWrapper":
+        self.scaler_y.partial_fit(as_float_array(data, self.dtype))
+        return self
 
     def transform_y(self, data: np.array) -> np.array:
-        return self.scaler_y.transform(data)
+        return self.scaler_y.transform(as_float_array(data, self.dtype))
 
     def inverse_transform_y(self, data: np.array) -> np.array:
-        return self.scaler_y.inverse_transform(data)
+        return self.scaler_y.inverse_transform(as_float_array(data, self.dtype))
+
+    def merge(self, other: "StandardScalerWrapper") -> "StandardScalerWrapper":
+        """
+        Merges the running mean/variance of a wrapper partially fitted on other chunks,
+        e.g. on another worker.
+        """
+        self.scaler_X = _merge_moments(self.scaler_X, other.scaler_X)
+        self.scaler_y = _merge_moments(self.scaler_y, other.scaler_y)
+        return self
@@ -0,0 +1,221 @@
+import tensorflow as tf
+import numpy as np
+from typing import Optional, Tuple
+from timepulse.utils.splits import make_windows, make_multivariate_windows
+
+
+def make_windowed_dataset(
+    values: np.array,
+    window_size: int = 7,
+    horizon: int = 1,
+    target_column: Optional[int] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+    batch_size: int = 32,
+    shuffle: bool = False,
+    seed: Optional[int] = None,
+    dtype: np.dtype = np.float32,
+) -> tf.data.Dataset:
+    """
+    Creates a tf.data.Dataset of (window, label) batches built on the fly.
+
+    Windows are strided views on `values` (see `make_windows`), only the rows of the
+    current batch are copied, so the series itself is the only full-size array in memory.
+
+    Parameters
+    ----------
+    values : np.array
+        1D series, or 2D (n_timesteps, n_features) array when `target_column` is set.
+        Memory-mapped arrays are read lazily as well.
+
+    window_size : int, optional, default: 7
+        Number of timesteps in each window.
+
+    horizon : int, optional, default: 1
+        Number of timesteps in each label.
+
+    target_column : int, optional
+        Column of a 2D `values` array the labels are taken from.
+
+    start, end : int, optional
+        Range of window indexes to serve, as in `windows[start:end]`. Defaults to all windows.
+
+    batch_size : int, optional, default: 32
+        Number of windows per batch.
+
+    shuffle : bool, optional, default: False
+        Whether to reshuffle the window order at every epoch.
+
+    seed : int, optional
+        Seed of the shuffling.
+
+    dtype : np.dtype, optional, default: np.float32
+        dtype of the yielded windows and labels.
+
+    Returns
+    -------
+    tf.data.Dataset
+        Prefetched dataset yielding (windows, labels) batches.
+
+    Example
+    -------
+    dataset = make_windowed_dataset(values, window_size=7, horizon=1, batch_size=128, shuffle=True)
+    """
+    if target_column is None:
+        windows, labels = make_windows(
+            values, window_size=window_size, horizon=horizon, copy=False
+        )
+    else:
+        windows, labels = make_multivariate_windows(
+            values,
+            window_size=window_size,
+            horizon=horizon,
+            target_column=target_column,
+        )
+    window_indexes = np.arange(len(windows))[start:end]
+    rng = np.random.default_rng(seed)
+
+    def generate_batches():
+        indexes = rng.permutation(window_indexes) if shuffle else window_indexes
+        for i in range(0, len(indexes), batch_size):
+            batch_indexes = indexes[i : i + batch_size]
+            yield (
+                windows[batch_indexes].astype(dtype, copy=False),
+                labels[batch_indexes].astype(dtype, copy=False),
+            )
+
+    dataset = tf.data.Dataset.from_generator(
+        generate_batches,
+        output_signature=(
+            tf.TensorSpec(shape=(None,) + windows.shape[1:], dtype=dtype),
+            tf.TensorSpec(shape=(None,) + labels.shape[1:], dtype=dtype),
+        ),
+    )
+    return dataset.prefetch(tf.data.AUTOTUNE)
+
+
+def make_windowed_datasets(
+    values: np.array,
+    window_size: int = 7,
+    horizon: int = 1,
+    target_column: Optional[int] = None,
+    test_split: float = 0.1,
+    batch_size: int = 32,
+    shuffle: bool = True,
+    seed: Optional[int] = None,
+    dtype: np.dtype = np.float32,
+) -> Tuple[tf.data.Dataset, tf.data.Dataset]:
+    """
+    Creates lazily windowed train and test datasets split chronologically.
+
+    The boundary is the one of `make_train_test_splits`: the last `test_split` share of the
+    windows is used for testing. Only the training windows are shuffled.
+
+    Parameters
+    ----------
+    values, window_size, horizon, target_column, batch_size, seed, dtype
+        See `make_windowed_dataset`.
+
+    test_split : float, optional, default: 0.1
+        Share of the windows used for testing.
+
+    shuffle : bool, optional, default: True
+        Whether to reshuffle the training windows at every epoch.
+
+    Returns
+    -------
+    Tuple[tf.data.Dataset, tf.data.Dataset]
+        The train and test datasets. Both can be passed to the `fit` methods of
+        `MultivariateDense`, `LSTM` and `NBeats` in place of X_train and X_val.
+
+    Example
+    -------
+    train_dataset, test_dataset = make_windowed_datasets(values, window_size=7, test_split=0.2)
+    model_instance.fit(train_dataset, X_val=test_dataset)
+    """
+    n_windows = len(values) - (window_size + horizon - 1)
+    split_size = int(n_windows * (1 - test_split))
+    kwargs = dict(
+        window_size=window_size,
+        horizon=horizon,
+        target_column=target_column,
+        batch_size=batch_size,
+        seed=seed,
+        dtype=dtype,
+    )
+    train_dataset = make_windowed_dataset(
+        values, end=split_size, shuffle=shuffle, **kwargs
+    )
+    test_dataset = make_windowed_dataset(values, start=split_size, **kwargs)
+    return train_dataset, test_dataset
+
+
+def make_array_dataset(
+    X: np.array,
+    y: np.array,
+    batch_size: int = 32,
+    shuffle: bool = False,
+    seed: Optional[int] = None,
+    cache: bool = True,
+) -> tf.data.Dataset:
+    """
+    Creates a tf.data input pipeline over in-memory arrays.
+
+    Batches are prefetched, so the next ones are prepared while the current one is trained
+    on. Without shuffling, the batches are cached after the first epoch. With shuffling, the
+    arrays are held as tensors and every epoch gathers whole batches along a new permutation,
+    like Keras does for arrays, instead of shuffling sample by sample.
+
+    Parameters
+    ----------
+    X, y : np.array
+        Inputs and labels, with the same first dimension.
+
+    batch_size : int, optional, default: 32
+        Number of samples per batch.
+
+    shuffle : bool, optional, default: False
+        Whether to reshuffle the samples at every epoch, as Keras does for training arrays.
+
+    seed : int, optional
+        Seed of the shuffling.
+
+    cache : bool, optional, default: True
+        Whether to cache the batches of an unshuffled dataset after the first epoch.
+
+    Returns
+    -------
+    tf.data.Dataset
+        Prefetched dataset yielding (X, y) batches.
+
+    Example
+    -------
+    train_dataset = make_array_dataset(X_train, y_train, batch_size=1024, shuffle=True)
+    """
+    if not shuffle:
+        dataset = tf.data.Dataset.from_tensor_slices((X, y)).batch(batch_size)
+        if cache:
+            dataset = dataset.cache()
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+    X, y = tf.convert_to_tensor(X), tf.convert_to_tensor(y)
+    n_samples = len(X)
+    n_batches = -(-n_samples // batch_size)
+
+    def epoch_indexes(epoch_seed):
+        permutation = tf.random.experimental.stateless_shuffle(
+            tf.range(n_samples, dtype=tf.int64),
+            seed=tf.stack([epoch_seed, tf.constant(0, tf.int64)]),
+        )
+        return tf.data.Dataset.range(n_batches).map(
+            lambda i: permutation[i * batch_size : (i + 1) * batch_size]
+        )
+
+    # Every new iterator, i.e. every epoch, draws a new seed, reproducibly given `seed`
+    epoch_seeds = tf.data.Dataset.random(seed=seed, rerandomize_each_iteration=True)
+    dataset = epoch_seeds.take(1).flat_map(epoch_indexes)
+    dataset = dataset.map(
+        lambda indexes: (tf.gather(X, indexes), tf.gather(y, indexes)),
+        num_parallel_calls=tf.data.AUTOTUNE,
+    )
+    return dataset.prefetch(tf.data.AUTOTUNE)
@@ -0,0 +1,58 @@
+import numpy as np
+from typing import Optional, Union
+
+# None keeps the dtypes of the data, e.g. float64 from pandas and sklearn
+_float_dtype: Optional[np.dtype] = None
+
+
+def set_float_dtype(dtype: Union[np.dtype, str, None]) -> None:
+    """
+    Sets the float dtype used end to end by windowing, scaling and the model wrappers.
+
+    Parameters
+    ----------
+    dtype : np.dtype, str or None
+        A floating dtype, e.g. np.float32 to halve the memory of large training sets and
+        match the float32 computations of Keras. None restores the default of keeping the
+        dtypes of the data.
+
+    Example
+    -------
+    set_float_dtype(np.float32)
+    X_train, X_test, y_train, y_test = make_window_splits(values, size=7)  # float32
+    """
+    global _float_dtype
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"Expected a floating dtype, got {dtype}")
+    _float_dtype = dtype
+
+
+def get_float_dtype() -> Optional[np.dtype]:
+    """
+    Returns the float dtype set with `set_float_dtype`, None by default.
+    """
+    return _float_dtype
+
+
+def resolve_float_dtype(dtype: Optional[np.dtype] = None) -> Optional[np.dtype]:
+    """
+    Returns the dtype given for a call, or the global float dtype when it is None.
+    """
+    return _float_dtype if dtype is None else np.dtype(dtype)
+
+
+def as_float_array(data: np.array, dtype: Optional[np.dtype] = None) -> np.array:
+    """
+    Converts data to the dtype of the call or of the global policy.
+
+    Arrays that already have that dtype are returned without a copy, and data is left
+    unchanged when no dtype is set. None is passed through.
+    """
+    if data is None:
+        return None
+    dtype = resolve_float_dtype(dtype)
+    if dtype is None:
+        return data
+    return np.asarray(data, dtype=dtype)
@@ -1,8 +1,10 @@
 import tensorflow as tf
 import os
 import numpy as np
-from typing import Tuple, Dict, Type
+from typing import Tuple, Dict, Type, Optional
 from timepulse.metrics.regression_metrics import evaluate_preds
+from timepulse.processing.scaling_layers import make_scaling_layer
+from timepulse.utils.datasets import make_array_dataset
 
 
 def create_model_checkpoint(
@@ -58,6 +60,142 @@ def create_early_stopping(
     )
 
 
+def fit_dataset(
+    model_instance: Type,
+    train_dataset: tf.data.Dataset,
+    val_dataset: Optional[tf.data.Dataset] = None,
+    verbose: int = 0,
+) -> None:
+    """
+    Train a Keras model wrapper on batched (X, y) datasets.
+
+    Parameters
+    ----------
+    model_instance : Type
+        A built and compiled `MultivariateDense`, `LSTM` or `NBeats` instance.
+    train_dataset : tf.data.Dataset
+        Batched training data, e.g. from `timepulse.utils.datasets.make_windowed_datasets`.
+    val_dataset : tf.data.Dataset, optional
+        Batched validation data.
+    verbose : int, optional
+        Verbosity mode (default is 0).
+
+    Raises
+    ------
+    ValueError
+        If the model has a scaler, since datasets are consumed without being scaled.
+
+    Example
+    -------
+    fit_dataset(model_instance, train_dataset, val_dataset)
+    """
+    if model_instance.scaler_X is not None:
+        raise ValueError(
+            "Datasets are not scaled by the model, create it with scaler_class=None "
+            "and scale the series before windowing"
+        )
+    model_instance.model.fit(
+        train_dataset,
+        epochs=model_instance.epochs,
+        verbose=verbose,
+        validation_data=val_dataset,
+        callbacks=model_instance.callbacks,
+    )
+
+
+def fit_arrays(
+    model_instance: Type,
+    X_train: np.array,
+    y_train: np.array,
+    X_val: np.array,
+    y_val: np.array,
+    verbose: int = 0,
+) -> None:
+    """
+    Train a Keras model wrapper on prepared (scaled and shaped) arrays.
+
+    With `use_tf_data` set on the wrapper, the arrays are fed through cached, shuffled,
+    batched and prefetched tf.data pipelines, see `make_array_dataset` in
+    `timepulse.utils.datasets`, instead of being passed to Keras directly.
+
+    Parameters
+    ----------
+    model_instance : Type
+        A built and compiled `MultivariateDense`, `LSTM` or `NBeats` instance.
+    X_train, y_train : np.array
+        Training inputs and labels.
+    X_val, y_val : np.array
+        Validation inputs and labels.
+    verbose : int, optional
+        Verbosity mode (default is 0).
+
+    Example
+    -------
+    fit_arrays(model_instance, X_train, y_train, X_val, y_val)
+    """
+    if not model_instance.use_tf_data:
+        model_instance.model.fit(
+            X_train,
+            y_train,
+            epochs=model_instance.epochs,
+            batch_size=model_instance.batch_size,
+            verbose=verbose,
+            validation_data=(X_val, y_val),
+            callbacks=model_instance.callbacks,
+        )
+        return
+    # Keras batches arrays by 32 when no batch size is given
+    batch_size = model_instance.batch_size or 32
+    model_instance.model.fit(
+        make_array_dataset(X_train, y_train, batch_size=batch_size, shuffle=True),
+        epochs=model_instance.epochs,
+        verbose=verbose,
+        validation_data=make_array_dataset(X_val, y_val, batch_size=batch_size),
+        callbacks=model_instance.callbacks,
+    )
+
+
+def fold_scalers(model_instance: Type, input_shape: Tuple) -> tf.keras.Model:
+    """
+    Folds the fitted scalers of a Keras model wrapper into its model.
+
+    The returned model scales its inputs and unscales its outputs with Keras layers, so it
+    takes raw inputs and returns predictions in the original units in one graph call, and
+    can be saved and served without the sklearn scalers.
+
+    Parameters
+    ----------
+    model_instance : Type
+        A fitted `MultivariateDense`, `LSTM` or `NBeats` instance with a
+        `MinMaxScalerWrapper` or `StandardScalerWrapper`.
+    input_shape : Tuple
+        Shape of one raw input, e.g. X_train.shape[1:]. Inputs are reshaped to the input
+        shape of the model after scaling.
+
+    Returns
+    -------
+    tf.keras.Model
+        Model mapping raw inputs to unscaled predictions.
+
+    Example
+    -------
+    serving_model = fold_scalers(model_instance, input_shape=X_train.shape[1:])
+    serving_model.save("storage/serving_model")
+    """
+    inputs = tf.keras.layers.Input(shape=input_shape, name="raw_input")
+    x = make_scaling_layer(model_instance.scaler_X.scaler_X, name="scale_input")(inputs)
+    model_input_shape = tuple(model_instance.model.input_shape[1:])
+    if tuple(input_shape) != model_input_shape:
+        x = tf.keras.layers.Reshape(model_input_shape)(x)
+    x = model_instance.model(x)
+    outputs = make_scaling_layer(
+        model_instance.scaler_y.scaler_y, invert=True, name="unscale_output"
+    )(x)
+    return tf.keras.Model(
+        inputs=inputs, outputs=outputs, name=f"{model_instance.model.name}_serving"
+    )
+
+
 def run_model(
     model_instance: Type,
     X_train: np.array,
@@ -1,25 +1,50 @@
 import numpy as np
 import pandas as pd
+from concurrent.futures import Future
 from sklearn.model_selection import StratifiedShuffleSplit
-from typing import Union, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Union, Tuple
+from timepulse.utils.dtypes import as_float_array, resolve_float_dtype
 
 
 def create_multivar_dataframe(
-    base_df: pd.DataFrame, *additional_dfs: pd.DataFrame, interval: str = "M"
+    base_df: pd.DataFrame,
+    *additional_dfs: Union[pd.DataFrame, Future],
+    interval: str = "M",
+    fill_value: Union[Any, Dict[str, Any]] = 0,
+    dtype: Union[type, Dict[str, type], None] = int,
+    asof: bool = False,
+    tolerance: Optional[pd.Timedelta] = None,
 ) -> pd.DataFrame:
     """
     Create a multivariate DataFrame by merging a base DataFrame with additional DataFrames based on a date range.
 
+    All additional DataFrames are aligned onto the date range of the base DataFrame in one pass, then filled,
+    cast and joined to the base DataFrame at once.
+
     Parameters:
     - base_df (pd.DataFrame): The base DataFrame.
-    - additional_dfs (list of pd.DataFrame): List of additional DataFrames to be merged based on the date range.
+    - additional_dfs (list of pd.DataFrame or Future): List of additional DataFrames to be merged based on the date range.
+      Futures, e.g. from `timepulse.data.data_collection.prefetch_sources`, are waited for in order.
+    - interval (str): Frequency of the date range between the first and last date of base_df. Defaults to "M".
+    - fill_value (scalar or dict): Value for dates missing from an additional DataFrame, or a dict of column -> value.
+      "ffill" carries the last known value forward and None leaves NaN, as do columns missing from the dict.
+      Defaults to 0.
+    - dtype (type or dict, optional): dtype of the additional columns, or a dict of column -> dtype. None keeps the
+      dtypes. Defaults to int.
+    - asof (bool): Match every date of the range with the last earlier or equal date of each additional DataFrame
+      instead of the exact date, for sources reported at coarser or irregular timestamps. Defaults to False.
+    - tolerance (pd.Timedelta, optional): Maximum distance of an as-of match.
 
     Returns:
     - multivar_df (pd.DataFrame): The resulting multivariate DataFrame.
 
     Examples:
     - multivar_df = create_multivar_dataframe(df, monthly_strigency_index_df, monthly_holidays_df, monthly_weather_history_df)
+    - multivar_df = create_multivar_dataframe(df, weekly_weather_df, asof=True, fill_value="ffill", dtype=np.float32)
     """
+    if not additional_dfs:
+        return base_df
+
     # Find the minimum and maximum dates from the base DataFrame
     min_date = base_df.index.min()
     max_date = base_df.index.max()
@@ -27,47 +52,91 @@ def create_multivar_dataframe(
     # Create a monthly date range with the last day of each month
     date_range = pd.date_range(start=min_date, end=max_date, freq=interval)
 
-    # Create a DataFrame with the date range to ensure complete coverage
-    complete_date_range_df = pd.DataFrame({"Date": date_range})
-    complete_date_range_df = complete_date_range_df.set_index(["Date"])
-
-    # Initialize the multivariate DataFrame with the base DataFrame
-    multivar_df = base_df
-
-    # Merge additional DataFrames based on the date range
-    for additional_df in additional_dfs:
-        # Merge with the complete date range DataFrame to ensure all dates are included
-        merged_df = pd.merge(complete_date_range_df, additional_df, left_index=True, right_index=True, how="left")
-        # Fill missing values with 0 and convert to integer
-        merged_df = merged_df.fillna(0).astype(int)
-        # Perform the merge with the multivariate DataFrame
-        multivar_df = pd.merge(multivar_df, merged_df, left_index=True, right_index=True, how="left")
+    additional_dfs = [
+        additional_df.result() if isinstance(additional_df, Future) else additional_df
+        for additional_df in additional_dfs
+    ]
+    if asof:
+        date_range_df = pd.DataFrame(index=date_range)
+        aligned_dfs = [
+            pd.merge_asof(
+                date_range_df, additional_df.sort_index(), left_index=True, right_index=True, tolerance=tolerance
+            )
+            for additional_df in additional_dfs
+        ]
+        aligned_df = pd.concat(aligned_dfs, axis=1)
+    else:
+        aligned_df = pd.concat(additional_dfs, axis=1).reindex(date_range)
+
+    # Fill missing values, per column when given a dict
+    if isinstance(fill_value, dict):
+        ffill_columns = [column for column, value in fill_value.items() if isinstance(value, str) and value == "ffill"]
+        if ffill_columns:
+            aligned_df[ffill_columns] = aligned_df[ffill_columns].ffill()
+        constant_values = {
+            column: value for column, value in fill_value.items() if value is not None and column not in ffill_columns
+        }
+        if constant_values:
+            aligned_df = aligned_df.fillna(constant_values)
+    elif isinstance(fill_value, str) and fill_value == "ffill":
+        aligned_df = aligned_df.ffill()
+    elif fill_value is not None:
+        aligned_df = aligned_df.fillna(fill_value)
+    if dtype is not None:
+        aligned_df = aligned_df.astype(dtype)
+
+    # Pick the aligned rows for every date of the base DataFrame in one go
+    aligned_df = aligned_df.reindex(base_df.index)
+    multivar_df = pd.concat([base_df, aligned_df], axis=1)
 
     return multivar_df
 
 
-def create_windowed_dataframe(base_df: pd.DataFrame, target_column: str, window_size: int = 3) -> pd.DataFrame:
+def create_windowed_dataframe(
+    base_df: pd.DataFrame, target_column: Union[str, List[str]], window_size: int = 3, dtype: Optional[np.dtype] = None
+) -> pd.DataFrame:
     """
     Create a windowed DataFrame by shifting values of a specified column.
 
     Parameters:
     - base_df (pd.DataFrame): The base DataFrame.
-    - target_column (str): The name of the column to create windowed features for.
+    - target_column (str or list of str): The name of the column, or columns, to create windowed features for.
     - window_size (int): The size of the window.
+    - dtype (np.dtype, optional): dtype of the returned DataFrame, e.g. np.float32. Defaults to the float dtype
+      of `timepulse.utils.dtypes.set_float_dtype`. Without one the lag columns keep floating dtypes and use float64
+      otherwise, like pd.Series.shift.
 
     Returns:
     - windowed_df (pd.DataFrame): The resulting windowed DataFrame.
 
     Examples:
     - multivar_df = create_windowed_dataframe(base_df=df, target_column='value', window_size=3)
+    - multivar_df = create_windowed_dataframe(base_df=df, target_column=['value', 'total_holidays'], dtype=np.float32)
     """
-    # Copy the subset of the DataFrame to avoid SettingWithCopyWarning
-    windowed_df = base_df.copy()
-
-    # Add windowed columns
-    for i in range(window_size):
-        # Use loc to modify the copied DataFrame
-        windowed_df[f"{target_column}-{i+1}"] = windowed_df[target_column].shift(periods=i + 1)
+    target_columns = [target_column] if isinstance(target_column, str) else list(target_column)
+    dtype = resolve_float_dtype(dtype)
+
+    # Build every lag column in one (n, len(target_columns) * window_size) block
+    lag_blocks = []
+    for column in target_columns:
+        values = base_df[column].to_numpy()
+        if dtype is not None:
+            lag_dtype = dtype
+        elif np.issubdtype(values.dtype, np.floating):
+            lag_dtype = values.dtype
+        else:
+            lag_dtype = np.float64
+        padded = np.concatenate([np.full(window_size, np.nan, dtype=lag_dtype), values.astype(lag_dtype, copy=False)])
+        # Row t holds values[t - window_size : t + 1], reversed columns give lags 1..window_size
+        windows = np.lib.stride_tricks.sliding_window_view(padded, window_size + 1)
+        lag_blocks.append(windows[:, window_size - 1 :: -1] if window_size > 0 else windows[:, :0])
+    lag_df = pd.DataFrame(
+        np.concatenate(lag_blocks, axis=1),
+        index=base_df.index,
+        columns=[f"{column}-{i+1}" for column in target_columns for i in range(window_size)],
+    )
+
+    windowed_df = pd.concat([base_df if dtype is None else base_df.astype(dtype), lag_df], axis=1)
 
     # Drop rows with NaN values
     windowed_df = windowed_df.dropna()
@@ -85,11 +154,24 @@ def get_labelled_windows(x: np.array, horizon: int = 1) -> Tuple[np.array, np.ar
     return x[:, :-horizon], x[:, -horizon:]
 
 
-def make_windows(x: np.array, window_size: int = 7, horizon: int = 1) -> Tuple[np.array, np.array]:
+def make_windows(
+    x: np.array, window_size: int = 7, horizon: int = 1, copy: bool = True, dtype: Optional[np.dtype] = None
+) -> Tuple[np.array, np.array]:
     """
     Create function to view NumPy arrays as windows.
     Turns a 1D array into a 2D array of sequential windows of window_size.
+
+    With copy=False the windows and labels are read-only strided views on x instead of copies,
+    so no memory is allocated per window.
+
+    x is converted once to dtype, or to the float dtype of `timepulse.utils.dtypes.set_float_dtype`,
+    before windowing. By default the windows keep the dtype of x.
     """
+    x = as_float_array(x, dtype)
+    if not copy:
+        windowed_array = np.lib.stride_tricks.sliding_window_view(x, window_size + horizon)
+        return get_labelled_windows(windowed_array, horizon=horizon)
+
     # 1. Create a window of specific window_size (add the horizon on the end for later labelling)
     window_step = np.expand_dims(np.arange(window_size + horizon), axis=0)
 
@@ -105,6 +187,73 @@ def make_windows(x: np.array, window_size: int = 7, horizon: int = 1) -> Tuple[n
     return windows, labels
 
 
+def make_multivariate_windows(
+    x: Union[np.array, pd.DataFrame],
+    window_size: int = 7,
+    horizon: int = 1,
+    target_column: Union[int, str] = 0,
+    dtype: Optional[np.dtype] = None,
+) -> Tuple[np.array, np.array]:
+    """
+    View a multivariate series as windows without copying.
+    Turns a 2D (n_timesteps, n_features) array into read-only strided views of shape
+    (n_windows, window_size, n_features) and labels of shape (n_windows, horizon) taken from target_column.
+
+    E.g. if window_size=2, horizon=1, target_column=0
+    Input: [[1, 10], [2, 20], [3, 30]] -> Output: ([[[1, 10], [2, 20]]], [[3]])
+
+    x is converted once to dtype, or to the global float dtype, as in make_windows.
+    """
+    if isinstance(x, pd.DataFrame):
+        if isinstance(target_column, str):
+            target_column = x.columns.get_loc(target_column)
+        x = x.to_numpy(dtype=resolve_float_dtype(dtype))
+    x = as_float_array(x, dtype)
+
+    # (n_windows, n_features, window_size + horizon) -> (n_windows, window_size + horizon, n_features)
+    windowed_array = np.lib.stride_tricks.sliding_window_view(x, window_size + horizon, axis=0).transpose(0, 2, 1)
+
+    windows = windowed_array[:, :window_size, :]
+    labels = windowed_array[:, window_size:, target_column]
+
+    return windows, labels
+
+
+def make_panel_windows(
+    panel_df: pd.DataFrame,
+    id_column: str,
+    time_column: str,
+    value_column: str,
+    window_size: int = 7,
+    horizon: int = 1,
+    dtype: Optional[np.dtype] = None,
+) -> Tuple[np.array, np.array, np.array]:
+    """
+    Create the windows of every series of a long-format panel in one vectorized pass.
+    Rows are ordered by series and time, windows are taken over the whole value column and the ones
+    whose first and last step belong to different series are dropped, so no window spans two series.
+
+    Returns contiguous windows of shape (n_windows, window_size), labels of shape (n_windows, horizon)
+    and the series id of every window, grouped by series in sorted id order.
+    Values are converted to dtype, or to the global float dtype, as in make_windows.
+    """
+    series_ids = panel_df[id_column].to_numpy()
+    order = np.lexsort((panel_df[time_column].to_numpy(), series_ids))
+    series_ids = series_ids[order]
+    values = as_float_array(panel_df[value_column].to_numpy()[order], dtype)
+
+    # A window starting at i covers rows i .. i + window_size + horizon - 1 of the sorted panel
+    span = window_size + horizon
+    if len(values) < span:
+        return np.empty((0, window_size), values.dtype), np.empty((0, horizon), values.dtype), series_ids[:0]
+    starts = np.flatnonzero(series_ids[: len(series_ids) - span + 1] == series_ids[span - 1 :])
+
+    windows = np.lib.stride_tricks.sliding_window_view(values[: len(values) - horizon], window_size)[starts]
+    labels = np.lib.stride_tricks.sliding_window_view(values[window_size:], horizon)[starts]
+
+    return windows, labels, series_ids[starts]
+
+
 def make_train_test_splits(windows: np.array, labels: np.array, test_split: float = 0.1):
     """
     Splits matching pairs of windows and labels into train and test splits.
@@ -117,12 +266,59 @@ def make_train_test_splits(windows: np.array, labels: np.array, test_split: floa
     return train_windows, test_windows, train_labels, test_labels
 
 
-def make_window_splits(values: np.array, size: int = 10, horizon: int = 1):
+def make_window_splits(
+    values: np.array, size: int = 10, horizon: int = 1, copy: bool = True, dtype: Optional[np.dtype] = None
+):
     """
     Splits a time series into input windows and corresponding labels.
+    With copy=False all splits are read-only views on values (see make_windows).
     """
-    full_windows, full_labels = make_windows(values, window_size=size, horizon=horizon)
+    full_windows, full_labels = make_windows(values, window_size=size, horizon=horizon, copy=copy, dtype=dtype)
 
     train_windows, test_windows, train_labels, test_labels = make_train_test_splits(full_windows, full_labels)
 
     return train_windows, test_windows, train_labels, test_labels
+
+
+def make_backtest_splits(
+    n_samples: int,
+    train_size: int,
+    horizon: int = 1,
+    step: Optional[int] = None,
+    gap: int = 0,
+    expanding: bool = True,
+    n_folds: Optional[int] = None,
+) -> Iterator[Tuple[slice, slice]]:
+    """
+    Yields chronological (train, test) index ranges for rolling-origin backtesting.
+
+    Fold k has its origin at train_size + k * step. Its training range ends at the origin and starts
+    at 0 (expanding window) or train_size samples earlier (sliding window). Its test range holds the
+    horizon samples that start gap samples after the origin. Folds stop once the test range would
+    pass n_samples. With n_folds only the last n_folds folds are kept.
+
+    E.g. n_samples=10, train_size=4, horizon=2, step=2, gap=1, expanding=True
+    Output: (0:4, 5:7), (0:6, 7:9)
+    """
+    step = horizon if step is None else step
+    if train_size < 1 or horizon < 1 or step < 1 or gap < 0:
+        raise ValueError("train_size, horizon and step must be positive and gap must not be negative")
+
+    origins = np.arange(train_size, n_samples - gap - horizon + 1, step)
+    if n_folds is not None:
+        # Keep the most recent folds
+        origins = origins[max(len(origins) - n_folds, 0) :]
+    for origin in origins.tolist():
+        train_start = 0 if expanding else origin - train_size
+        yield slice(train_start, origin), slice(origin + gap, origin + gap + horizon)
+
+
+def make_backtest_folds(
+    windows: np.array, labels: np.array, train_size: int, horizon: int = 1, **kwargs
+) -> Iterator[Tuple[np.array, np.array, np.array, np.array]]:
+    """
+    Yields train_windows, test_windows, train_labels, test_labels for every fold of make_backtest_splits.
+    Folds are slices, so they are views on windows and labels and nothing is copied.
+    """
+    for train_slice, test_slice in make_backtest_splits(len(windows), train_size, horizon=horizon, **kwargs):
+        yield windows[train_slice], windows[test_slice], labels[train_slice], labels[test_slice]
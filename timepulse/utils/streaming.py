@@ -0,0 +1,130 @@
+import numpy as np
+from typing import Optional, Sequence, Union
+
+
+class StreamingWindower:
+    """
+    Fixed-size ring buffers holding the latest window of many series in one array.
+
+    Every value is written twice, at its ring position and window_size slots later, so the
+    latest window is always one contiguous slice of the buffer. Pushing a value is O(1) and
+    `current_window` returns a view without copying.
+
+    Parameters
+    ----------
+    window_size : int
+        Number of timesteps in each window.
+
+    n_series : int, optional, default: 1
+        Number of series. Series are addressed by their index in 0 .. n_series - 1.
+
+    n_exog : int, optional, default: 0
+        Number of exogenous features pushed along with every value.
+
+    dtype : np.dtype, optional, default: np.float32
+        dtype of the buffer.
+
+    Examples
+    --------
+    >>> windower = StreamingWindower(window_size=7, n_series=1000)
+    >>> windower.push_many(latest_values)
+    >>> y_pred = model_instance.predict(windower.current_windows())
+    >>> windower.push(12.5, series=3)
+    >>> windower.current_window(series=3)
+    """
+
+    def __init__(
+        self,
+        window_size: int,
+        n_series: int = 1,
+        n_exog: int = 0,
+        dtype: np.dtype = np.float32,
+    ) -> None:
+        self.window_size = window_size
+        self.n_series = n_series
+        self.n_exog = n_exog
+        self.buffer = np.zeros((n_series, 2 * window_size, 1 + n_exog), dtype=dtype)
+        self.positions = np.zeros(n_series, dtype=np.int64)
+        self.counts = np.zeros(n_series, dtype=np.int64)
+
+    def _row(self, value: float, exog: Optional[Sequence[float]]) -> np.array:
+        if self.n_exog == 0:
+            return value
+        return np.concatenate([[value], np.asarray(exog).reshape(self.n_exog)])
+
+    def push(
+        self, value: float, exog: Optional[Sequence[float]] = None, series: int = 0
+    ) -> None:
+        """
+        Appends one observation, and its exogenous features, to a series.
+        """
+        row = self._row(value, exog)
+        position = self.positions[series]
+        self.buffer[series, position] = row
+        self.buffer[series, position + self.window_size] = row
+        self.positions[series] = (position + 1) % self.window_size
+        self.counts[series] += 1
+
+    def push_many(
+        self,
+        values: np.array,
+        exog: Optional[np.array] = None,
+        series: Optional[Sequence[int]] = None,
+    ) -> None:
+        """
+        Appends one observation to each of several series at once.
+
+        `values` has one entry per series, `exog` has shape (len(values), n_exog). `series`
+        lists the distinct series the values belong to and defaults to all series in order.
+        """
+        series = np.arange(self.n_series) if series is None else np.asarray(series)
+        rows = np.asarray(values, dtype=self.buffer.dtype).reshape(-1, 1)
+        if self.n_exog:
+            rows = np.concatenate(
+                [rows, np.asarray(exog).reshape(-1, self.n_exog)], axis=1
+            )
+        positions = self.positions[series]
+        self.buffer[series, positions] = rows
+        self.buffer[series, positions + self.window_size] = rows
+        self.positions[series] = (positions + 1) % self.window_size
+        self.counts[series] += 1
+
+    def is_ready(self, series: Union[int, Sequence[int], None] = None) -> np.array:
+        """
+        Whether a full window has been pushed, for one series or an array of series (default all).
+        """
+        counts = self.counts if series is None else self.counts[series]
+        return counts >= self.window_size
+
+    def current_window(self, series: int = 0) -> np.array:
+        """
+        Returns the latest window of a series, oldest value first, as a read-only view.
+
+        The shape is (window_size,) without exogenous features and
+        (window_size, 1 + n_exog) with them, the value being the first feature.
+        """
+        if not self.is_ready(series):
+            raise ValueError(
+                f"Series {series} has {self.counts[series]} of {self.window_size} values"
+            )
+        position = self.positions[series]
+        window = self.buffer[series, position : position + self.window_size]
+        if self.n_exog == 0:
+            window = window[:, 0]
+        window = window.view()
+        window.flags.writeable = False
+        return window
+
+    def current_windows(self, series: Optional[Sequence[int]] = None) -> np.array:
+        """
+        Returns the latest windows of several series (default all) stacked for one predict call,
+        with shape (n, window_size) or (n, window_size, 1 + n_exog).
+        """
+        series = np.arange(self.n_series) if series is None else np.asarray(series)
+        if not np.all(self.is_ready(series)):
+            raise ValueError("Some series do not have a full window yet")
+        steps = self.positions[series][:, None] + np.arange(self.window_size)
+        windows = self.buffer[series[:, None], steps]
+        if self.n_exog == 0:
+            windows = windows[..., 0]
+        return windows
@@ -0,0 +1,162 @@
+import json
+import os
+import numpy as np
+import tensorflow as tf
+from typing import Optional, Tuple
+from timepulse.utils.datasets import make_windowed_datasets
+from timepulse.utils.splits import (
+    make_windows,
+    make_multivariate_windows,
+    make_train_test_splits,
+)
+
+VALUES_FILENAME = "values.npy"
+METADATA_FILENAME = "metadata.json"
+
+
+class WindowStore:
+    """
+    Windows of a series kept on disk as a memory-mapped `.npy` file.
+
+    Only the raw series and the window metadata are stored. Windows and labels are strided
+    views on the memory map, so worker processes opening the same store share one page-cached
+    copy of the series instead of each holding private window arrays.
+
+    Parameters
+    ----------
+    path : str
+        Directory written by `save_window_store`.
+
+    Attributes
+    ----------
+    values : np.memmap
+        Read-only memory map of the series, 1D or (n_timesteps, n_features).
+
+    window_size : int
+        Number of timesteps in each window.
+
+    horizon : int
+        Number of timesteps in each label.
+
+    target_column : int or None
+        Column of a 2D series the labels are taken from.
+
+    Examples
+    --------
+    >>> save_window_store("storage/sales", values, window_size=28, horizon=1)
+    >>> store = WindowStore("storage/sales")
+    >>> X_train, X_test, y_train, y_test = store.train_test_splits(test_split=0.2)
+    >>> train_dataset, test_dataset = store.datasets(batch_size=1024)
+    >>> model_instance.fit(train_dataset, X_val=test_dataset)
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(os.path.join(path, METADATA_FILENAME)) as f:
+            metadata = json.load(f)
+        self.path = path
+        self.window_size = metadata["window_size"]
+        self.horizon = metadata["horizon"]
+        self.target_column = metadata["target_column"]
+        self.values = np.load(os.path.join(path, VALUES_FILENAME), mmap_mode="r")
+
+    def windows(self) -> Tuple[np.array, np.array]:
+        """
+        Returns the windows and labels as read-only views on the memory map.
+        """
+        if self.target_column is None:
+            return make_windows(
+                self.values,
+                window_size=self.window_size,
+                horizon=self.horizon,
+                copy=False,
+            )
+        return make_multivariate_windows(
+            self.values,
+            window_size=self.window_size,
+            horizon=self.horizon,
+            target_column=self.target_column,
+        )
+
+    def train_test_splits(
+        self, test_split: float = 0.1
+    ) -> Tuple[np.array, np.array, np.array, np.array]:
+        """
+        Returns train_windows, test_windows, train_labels, test_labels as views on the memory map.
+        """
+        windows, labels = self.windows()
+        return make_train_test_splits(windows, labels, test_split=test_split)
+
+    def datasets(
+        self,
+        test_split: float = 0.1,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        seed: Optional[int] = None,
+    ) -> Tuple[tf.data.Dataset, tf.data.Dataset]:
+        """
+        Returns train and test datasets reading their batches from the memory map,
+        see `timepulse.utils.datasets.make_windowed_datasets`.
+        """
+        return make_windowed_datasets(
+            self.values,
+            window_size=self.window_size,
+            horizon=self.horizon,
+            target_column=self.target_column,
+            test_split=test_split,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            seed=seed,
+        )
+
+
+def save_window_store(
+    path: str,
+    values: np.array,
+    window_size: int = 7,
+    horizon: int = 1,
+    target_column: Optional[int] = None,
+    dtype: Optional[np.dtype] = None,
+) -> WindowStore:
+    """
+    Writes a series and its window metadata to a directory and opens it as a `WindowStore`.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the store, created if missing.
+
+    values : np.array
+        1D series, or 2D (n_timesteps, n_features) array when `target_column` is set.
+
+    window_size, horizon, target_column
+        See `make_windows` and `make_multivariate_windows`.
+
+    dtype : np.dtype, optional
+        dtype the series is stored with, e.g. np.float32. Defaults to the dtype of `values`.
+
+    Returns
+    -------
+    WindowStore
+        The store, memory-mapped from the written file.
+
+    Example
+    -------
+    store = save_window_store("storage/sales", values, window_size=28, dtype=np.float32)
+    """
+    os.makedirs(path, exist_ok=True)
+    np.save(
+        os.path.join(path, VALUES_FILENAME),
+        np.asarray(values, dtype=dtype),
+        allow_pickle=False,
+    )
+    # Metadata is written last, a store without it is incomplete
+    with open(os.path.join(path, METADATA_FILENAME), "w") as f:
+        json.dump(
+            {
+                "window_size": window_size,
+                "horizon": horizon,
+                "target_column": target_column,
+            },
+            f,
+        )
+    return WindowStore(path)